@@ -1,21 +1,63 @@
 # Standard library imports
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Sequence
 
 # Third party imports
 import numpy as np
-from scipy.spatial.transform import Rotation as R
+from sgp4.api import SatrecArray
 
 # Local imports
+from pystrodynamics.utils.argument_checking import require_element_types, require_type
 from pystrodynamics.simulation_objects.simulation_object import SimulationObject
-from pystrodynamics.utils.sun import get_earth_sun_vector_teme_at_epoch
+from pystrodynamics.utils.sun import get_cached_earth_sun_vector_gcrs_at_epoch, get_cached_earth_sun_vector_teme_at_epoch
 from pystrodynamics.utils.eclipse import is_in_eclipse
-from pystrodynamics.utils.propagation import tle_and_epoch_to_state_vectors, state_vectors_to_coe
+from pystrodynamics.utils.propagation import (
+    ClassicalOrbitalElements,
+    TemeToGcrsRotationGrid,
+    datetime_to_jd_fr,
+    datetimes_to_jd_fr,
+    parse_tle,
+    state_vectors_to_coe,
+    teme_to_gcrs_rotation_matrix,
+)
+from pystrodynamics.utils.rotations import gcrs_to_lvlh_matrix
+
+# Reference frames the state vectors are available in, mapped to the names of the
+# position and velocity vector properties in that frame
+_STATE_VECTOR_PROPERTIES = {
+    "TEME": ("position_vector_teme", "velocity_vector_teme"),
+    "GCRS": ("position_vector_gcrs", "velocity_vector_gcrs"),
+}
+
+
+def _teme_to_gcrs_rotation_matrix(epoch: datetime, rotation_grid: Optional[TemeToGcrsRotationGrid]) -> np.ndarray:
+    """Returns the TEME to GCRS rotation at an epoch, interpolated from the grid if one is given."""
+    if rotation_grid is None:
+        return teme_to_gcrs_rotation_matrix(epoch)
+    if __debug__:
+        require_type("rotation_grid", rotation_grid, TemeToGcrsRotationGrid)
+    return rotation_grid.rotation_matrix(epoch)
 
 
 class OrbitalObject(SimulationObject):
     """Simulation object for things orbiting Earth."""
-    
+
+    __slots__ = (
+        "epoch",
+        "tle_line1",
+        "tle_line2",
+        "norad_id",
+        "_satrec",
+        "__position_vector_teme",
+        "__velocity_vector_teme",
+        "__position_vector_gcrs",
+        "__velocity_vector_gcrs",
+        "__gcrs_to_lvlh_matrix",
+        "_classical_orbital_elements",
+        "_earth_sun_vector_teme",
+        "_earth_sun_vector_gcrs",
+    )
+
     def __init__(self, name: str, initial_epoch: datetime, tle_line1: str, tle_line2: str, norad_id: Optional[str] = None) -> None:
         """Initializes an OrbitalObject instance.
         
@@ -34,20 +76,24 @@ class OrbitalObject(SimulationObject):
         
         """
         # Argument checking
-        if not isinstance(initial_epoch, datetime):
-            raise TypeError(f"arg 'initial_epoch' must be of type datetime, not {type(initial_epoch)}")
+        if __debug__:
+            require_type("initial_epoch", initial_epoch, datetime)
         
         super().__init__(name)
         self.tle_line1 = tle_line1
         self.tle_line2 = tle_line2
         self.norad_id = norad_id
+        # Objects sharing a TLE share one parsed SGP4 record
+        self._satrec = parse_tle(tle_line1, tle_line2)
         self.update_state(initial_epoch)
 
-    def update_state(self, epoch: datetime) -> None:
+    def update_state(self, epoch: datetime, rotation_grid: Optional[TemeToGcrsRotationGrid] = None) -> None:
         """Updates the state of the Sun object with information for the new epoch.
 
         Args:
             epoch (datetime): new epoch from which to derive values.
+            rotation_grid (Optional[TemeToGcrsRotationGrid]): precomputed TEME to GCRS rotations
+                to interpolate instead of evaluating the exact rotation. Defaults to None.
 
         Returns:
             None
@@ -56,26 +102,138 @@ class OrbitalObject(SimulationObject):
             TypeError: if arguments are not of expected type.
 
         """
-        if not isinstance(epoch, datetime):
-            raise TypeError(f"arg 'epoch' must be of type datetime, not {type(epoch)}")
+        if __debug__:
+            require_type("epoch", epoch, datetime)
         epoch = epoch.replace(tzinfo=timezone.utc)
+        jd, fr = datetime_to_jd_fr(epoch)
+        _, position_tuple, velocity_tuple = self._satrec.sgp4(jd, fr)
+        position_vector_teme = np.array(position_tuple)
+        velocity_vector_teme = np.array(velocity_tuple)
+        teme_to_gcrs = _teme_to_gcrs_rotation_matrix(epoch, rotation_grid)
+        self._set_state(epoch, position_vector_teme, velocity_vector_teme, teme_to_gcrs @ position_vector_teme, teme_to_gcrs @ velocity_vector_teme)
+
+    @classmethod
+    def batch_update_state(
+        cls,
+        objects: list["OrbitalObject"],
+        epoch: datetime,
+        dtype: np.dtype = np.float64,
+        rotation_grid: Optional[TemeToGcrsRotationGrid] = None,
+    ) -> None:
+        """Updates the state of many OrbitalObjects to the same epoch at once.
+
+        Propagates all objects with a single vectorized SGP4 call and shares the
+        TEME to GCRS rotation between them, which is much faster than calling
+        update_state on each object for large constellations.
+
+        SGP4 always runs in double precision. Passing dtype=np.float32 stores the
+        resulting state vectors, and everything derived from them, in single
+        precision, halving memory traffic for large ensembles at the cost of
+        roughly metre-level position error. Not suitable for conjunction analysis.
+
+        Args:
+            objects (list[OrbitalObject]): the objects to update.
+            epoch (datetime): new epoch from which to derive values.
+            dtype (np.dtype): floating point type of the stored state vectors. Defaults to np.float64.
+            rotation_grid (Optional[TemeToGcrsRotationGrid]): precomputed TEME to GCRS rotations
+                to interpolate instead of evaluating the exact rotation. Defaults to None.
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: if arguments are not of expected type.
+
+        """
+        if __debug__:
+            require_type("epoch", epoch, datetime)
+            require_element_types("objects", objects, OrbitalObject)
+        if not objects:
+            return
+
+        epoch = epoch.replace(tzinfo=timezone.utc)
+        jd, fr = datetime_to_jd_fr(epoch)
+        _, position_vectors_teme, velocity_vectors_teme = SatrecArray([obj._satrec for obj in objects]).sgp4(np.array([jd]), np.array([fr]))
+        position_vectors_teme = position_vectors_teme[:, 0].astype(dtype, copy=False)
+        velocity_vectors_teme = velocity_vectors_teme[:, 0].astype(dtype, copy=False)
+
+        # Rotate every object to GCRS with one (N, 3) @ (3, 3) product
+        teme_to_gcrs = _teme_to_gcrs_rotation_matrix(epoch, rotation_grid).astype(dtype, copy=False)
+        position_vectors_gcrs = position_vectors_teme @ teme_to_gcrs.T
+        velocity_vectors_gcrs = velocity_vectors_teme @ teme_to_gcrs.T
+
+        for i, obj in enumerate(objects):
+            obj._set_state(epoch, position_vectors_teme[i], velocity_vectors_teme[i], position_vectors_gcrs[i], velocity_vectors_gcrs[i])
+
+    def propagate_range(self, epochs: Sequence[datetime]) -> tuple[np.ndarray, np.ndarray]:
+        """Propagates the object over many epochs at once without changing its state.
+
+        All epochs are propagated with a single vectorized SGP4 call, which is much
+        faster than calling update_state in a loop when sweeping a timeline.
+
+        Args:
+            epochs (Sequence[datetime]): the epochs at which to compute the state.
+
+        Returns:
+            position_vectors_teme (np.ndarray): (T, 3) position vectors of the object in TEME at each epoch.
+            velocity_vectors_teme (np.ndarray): (T, 3) velocity vectors of the object in TEME at each epoch.
+
+        Raises:
+            TypeError: if arguments are not of expected type.
+
+        """
+        if __debug__:
+            require_element_types("epochs", epochs, datetime)
+
+        _, position_vectors_teme, velocity_vectors_teme = self._satrec.sgp4_array(*datetimes_to_jd_fr(epochs))
+        return position_vectors_teme, velocity_vectors_teme
+
+    def _set_state(
+        self,
+        epoch: datetime,
+        position_vector_teme: np.ndarray,
+        velocity_vector_teme: np.ndarray,
+        position_vector_gcrs: np.ndarray,
+        velocity_vector_gcrs: np.ndarray,
+    ) -> None:
+        """Stores the propagated state for an epoch and resets everything derived from the previous one."""
         self.epoch = epoch
-        self.__position_vector_teme, self.__velocity_vector_teme = tle_and_epoch_to_state_vectors(self.tle_line1, self.tle_line2, self.epoch, "TEME")
+        self.__position_vector_teme = position_vector_teme
+        self.__velocity_vector_teme = velocity_vector_teme
+        self.__position_vector_gcrs = position_vector_gcrs
+        self.__velocity_vector_gcrs = velocity_vector_gcrs
+        self._classical_orbital_elements = {}
+        # Derived quantities are computed lazily, once per epoch
+        self.__gcrs_to_lvlh_matrix = None
+        self._earth_sun_vector_teme = None
+        self._earth_sun_vector_gcrs = None
 
-    @property
-    def classical_orbital_elements(self, reference_frame: Optional[str] = "TEME"):
+    def classical_orbital_elements(self, reference_frame: Optional[str] = "TEME") -> ClassicalOrbitalElements:
+        """The classical orbital elements of the object in the given frame.
+
+        Computed once per epoch and frame, then cached until the next state update.
+
+        Args:
+            reference_frame (Optional[str]): the frame of the state vectors to use, one of ['GCRS', 'TEME']. Defaults to 'TEME'.
+
+        Returns:
+            classical_orbital_elements (ClassicalOrbitalElements): the orbital elements of the object.
+
+        Raises:
+            TypeError: if arguments are not of expected type.
+            ValueError: if 'reference_frame' is not one of the accepted values.
+
+        """
         # Argument checking
-        if not isinstance(reference_frame, str):
-            raise TypeError(f"arg 'reference_frame' must be of type str, not {type(reference_frame)}")
-        if reference_frame not in ["GCRS", "TEME"]:
-            raise ValueError(f"'reference_frame' must be one of ['GCRS', 'TEME'] (gave {reference_frame}")
-
-        match reference_frame:
-            case "TEME":
-                return state_vectors_to_coe(self.position_vector_teme, self.velocity_vector_teme)
-            case "GCRS":
-                position_gcrs, velocity_gcrs = self.position_and_velocity_vectors_gcrs
-                return state_vectors_to_coe(position_gcrs, velocity_gcrs)
+        if __debug__:
+            require_type("reference_frame", reference_frame, str)
+        if reference_frame not in _STATE_VECTOR_PROPERTIES:
+            raise ValueError(f"'reference_frame' must be one of ['GCRS', 'TEME'] (gave {reference_frame})")
+
+        if reference_frame not in self._classical_orbital_elements:
+            position_vector_property, velocity_vector_property = _STATE_VECTOR_PROPERTIES[reference_frame]
+            self._classical_orbital_elements[reference_frame] = state_vectors_to_coe(getattr(self, position_vector_property), getattr(self, velocity_vector_property))
+        return self._classical_orbital_elements[reference_frame]
 
     @property
     def position_vector_teme(self) -> np.ndarray:
@@ -114,8 +272,7 @@ class OrbitalObject(SimulationObject):
             position_vector_gcrs (np.ndarray): the position vector of the object in GCRS.
 
         """
-        position_vector_gcrs, _ = tle_and_epoch_to_state_vectors(self.tle_line1, self.tle_line2, self.epoch, "GCRS")
-        return position_vector_gcrs
+        return self.__position_vector_gcrs
 
     @property
     def velocity_vector_gcrs(self) -> np.ndarray:
@@ -128,11 +285,10 @@ class OrbitalObject(SimulationObject):
             velocity_vector_gcrs (np.ndarray): the velocity vector of the object in GCRS.
 
         """
-        _, velocity_vector_gcrs = tle_and_epoch_to_state_vectors(self.tle_line1, self.tle_line2, self.epoch, "GCRS")
-        return velocity_vector_gcrs
+        return self.__velocity_vector_gcrs
 
     @property
-    def position_and_velocity_vectors_gcrs(self) -> np.ndarray:
+    def position_and_velocity_vectors_gcrs(self) -> tuple[np.ndarray, np.ndarray]:
         """The position and velocity vectors of the object in GCRS frame.
 
         Args:
@@ -143,9 +299,54 @@ class OrbitalObject(SimulationObject):
             velocity_vector_gcrs (np.ndarray): the velocity vector of the object in GCRS.
 
         """
-        return tle_and_epoch_to_state_vectors(self.tle_line1, self.tle_line2, self.epoch, "GCRS")
+        return self.__position_vector_gcrs, self.__velocity_vector_gcrs
+
+    @property
+    def gcrs_to_lvlh_matrix(self) -> np.ndarray:
+        """The rotation matrix from GCRS to the object's LVLH frame.
+
+        Args:
+            None
+
+        Returns:
+            gcrs_to_lvlh_matrix (np.ndarray): (3, 3) matrix taking GCRS vectors to LVLH.
+
+        """
+        if self.__gcrs_to_lvlh_matrix is None:
+            self.__gcrs_to_lvlh_matrix = gcrs_to_lvlh_matrix(self.__position_vector_gcrs, self.__velocity_vector_gcrs)
+        return self.__gcrs_to_lvlh_matrix
+
+    @property
+    def earth_sun_vector_teme(self) -> np.ndarray:
+        """The vector from the Earth to the Sun in TEME frame at the object's epoch.
+
+        Args:
+            None
+
+        Returns:
+            earth_sun_vector_teme (np.ndarray): Earth-Sun vector in TEME.
+
+        """
+        if self._earth_sun_vector_teme is None:
+            self._earth_sun_vector_teme = get_cached_earth_sun_vector_teme_at_epoch(self.epoch)
+        return self._earth_sun_vector_teme
+
+    @property
+    def earth_sun_vector_gcrs(self) -> np.ndarray:
+        """The vector from the Earth to the Sun in GCRS frame at the object's epoch.
+
+        Args:
+            None
+
+        Returns:
+            earth_sun_vector_gcrs (np.ndarray): Earth-Sun vector in GCRS.
+
+        """
+        if self._earth_sun_vector_gcrs is None:
+            self._earth_sun_vector_gcrs = get_cached_earth_sun_vector_gcrs_at_epoch(self.epoch)
+        return self._earth_sun_vector_gcrs
 
     @property
     def is_in_eclipse(self) -> bool:
         """Whether or not the object is in eclipse."""
-        return is_in_eclipse(self.position_vector_teme, get_earth_sun_vector_teme_at_epoch(self.epoch))
+        return is_in_eclipse(self.position_vector_teme, self.earth_sun_vector_teme)
@@ -7,6 +7,8 @@ from datetime import datetime
 # Local imports
 
 class SimulationObject(ABC):
+    __slots__ = ("name",)
+
     def __init__(self, name):
         self.name = name
 
@@ -1,16 +1,26 @@
 # Standard library imports
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Union
 
 # Third party imports
 import numpy as np
 from scipy.spatial.transform import Rotation as R
 
 # Local imports
+from pystrodynamics.utils.argument_checking import require_type
 from pystrodynamics.simulation_objects.orbital_object import OrbitalObject
-from pystrodynamics.utils.sun import get_earth_sun_vector_gcrs_at_epoch, get_earth_sun_vector_teme_at_epoch
 from pystrodynamics.simulation_objects.spacecraft_modules.basic_sensor import BasicSensor
-from pystrodynamics.utils.rotations import gcrs_to_lvlh_rotation
+from pystrodynamics.utils.math import unit_vector
+from pystrodynamics.utils.rotations import rotation_to_matrix
+
+# Reference frames sensor exclusion zones can be checked in, mapped to the name of the
+# body to frame matrix getter and of the spacecraft-Sun and spacecraft-Earth vector
+# properties in that frame. TEME has no stored attitude, so its rotation is passed in.
+_SENSOR_FRAME_HANDLERS = {
+    "GCRS": ("get_body_to_gcrs_matrix", "spacecraft_sun_vector_gcrs", "spacecraft_earth_vector_gcrs"),
+    "TEME": (None, "spacecraft_sun_vector_teme", "spacecraft_earth_vector_teme"),
+    "LVLH": ("get_body_to_lvlh_matrix", "spacecraft_sun_vector_lvlh", "spacecraft_earth_vector_lvlh"),
+}
 
 
 class Spacecraft(OrbitalObject):
@@ -20,7 +30,18 @@ class Spacecraft(OrbitalObject):
     
     Inherits from OrbitalObject to utilize orbital mechanics and state propagation functionalities.
     """
-    
+
+    __slots__ = (
+        "_body_to_gcrs_matrix",
+        "_body_to_lvlh_matrix",
+        "sensors",
+        "_sensor_arrays_key",
+        "_sensor_array_sensors",
+        "_sensor_boresights_body",
+        "_sensor_cos_sun_exclusion_angles",
+        "_sensor_cos_earth_exclusion_angles",
+    )
+
     def __init__(self, name: str, initial_epoch: datetime, tle_line1: str, tle_line2: str, norad_id: Optional[str] = None) -> None:
         """Initializes a Spacecraft instance.
         
@@ -39,8 +60,21 @@ class Spacecraft(OrbitalObject):
         
         """
         super().__init__(name, initial_epoch, tle_line1, tle_line2, norad_id)
-        self.body_to_gcrs_rotation = None
+        self._body_to_gcrs_matrix = None
+        self._body_to_lvlh_matrix = None
         self.sensors = []
+        # Structure-of-arrays view of the sensors for vectorized exclusion zone checks, rebuilt
+        # from `sensors` whenever sensors are added or any sensor's boresight or exclusion angles change
+        self._sensor_arrays_key = None
+        self._sensor_array_sensors = np.empty(0, dtype=object)
+        self._sensor_boresights_body = np.empty((0, 3))
+        self._sensor_cos_sun_exclusion_angles = np.empty(0)
+        self._sensor_cos_earth_exclusion_angles = np.empty(0)
+
+    def _set_state(self, *args, **kwargs) -> None:
+        super()._set_state(*args, **kwargs)
+        # The body to LVLH rotation depends on the orbit, so is recomputed on first use at the new epoch
+        self._body_to_lvlh_matrix = None
 
     # Position Vectors
 
@@ -52,7 +86,7 @@ class Spacecraft(OrbitalObject):
         Returns:
             np.ndarray: A numpy array representing the spacecraft-to-Earth vector in TEME coordinates.
         """
-        return -1 * self.position_vector_teme
+        return -self.position_vector_teme
 
     @property
     def spacecraft_earth_vector_gcrs(self) -> np.ndarray:
@@ -62,7 +96,7 @@ class Spacecraft(OrbitalObject):
         Returns:
             np.ndarray: A numpy array representing the spacecraft-to-Earth vector in GCRS coordinates.
         """
-        return -1 * self.position_vector_gcrs
+        return -self.position_vector_gcrs
 
     @property
     def spacecraft_earth_vector_lvlh(self) -> np.ndarray:
@@ -73,9 +107,7 @@ class Spacecraft(OrbitalObject):
             np.ndarray: A numpy array representing the spacecraft-to-Earth vector in LVLH coordinates.
         """
 
-        position_gcrs, velocity_gcrs = self.position_and_velocity_vectors_gcrs
-        gcrs_lvlh_rotation = gcrs_to_lvlh_rotation(position_gcrs, velocity_gcrs)
-        return gcrs_lvlh_rotation.apply(self.spacecraft_earth_vector_gcrs)
+        return self.gcrs_to_lvlh_matrix @ self.spacecraft_earth_vector_gcrs
 
     @property
     def spacecraft_sun_vector_teme(self) -> np.ndarray:
@@ -86,8 +118,7 @@ class Spacecraft(OrbitalObject):
             np.ndarray: A numpy array representing the spacecraft-to-Sun vector in TEME coordinates.
         """
 
-        earth_sun_vector_teme = get_earth_sun_vector_teme_at_epoch(self.epoch)
-        return earth_sun_vector_teme - self.position_vector_teme
+        return self.earth_sun_vector_teme - self.position_vector_teme
 
     @property
     def spacecraft_sun_vector_gcrs(self) -> np.ndarray:
@@ -98,8 +129,7 @@ class Spacecraft(OrbitalObject):
             np.ndarray: A numpy array representing the spacecraft-to-Sun vector in GCRS coordinates.
         """
 
-        earth_sun_vector_gcrs = get_earth_sun_vector_gcrs_at_epoch(self.epoch)
-        return earth_sun_vector_gcrs - self.position_vector_gcrs
+        return self.earth_sun_vector_gcrs - self.position_vector_gcrs
 
     @property
     def spacecraft_sun_vector_lvlh(self) -> np.ndarray:
@@ -110,9 +140,7 @@ class Spacecraft(OrbitalObject):
             np.ndarray: A numpy array representing the spacecraft-to-Sun vector in LVLH coordinates.
         """
 
-        position_gcrs, velocity_gcrs = self.position_and_velocity_vectors_gcrs
-        gcrs_lvlh_rotation = gcrs_to_lvlh_rotation(position_gcrs, velocity_gcrs)
-        return gcrs_lvlh_rotation.apply(self.spacecraft_sun_vector_gcrs)
+        return self.gcrs_to_lvlh_matrix @ self.spacecraft_sun_vector_gcrs
 
     # Sensor things
 
@@ -127,17 +155,83 @@ class Spacecraft(OrbitalObject):
             TypeError: If `sensor` is not an instance of `BasicSensor`.
         """
 
-        if not isinstance(sensor, BasicSensor):
-            raise TypeError(f"arg 'sensor' must be of type BasicSensor, not {type(sensor)}")
+        if __debug__:
+            require_type("sensor", sensor, BasicSensor)
         self.sensors.append(sensor)
+        self._sensor_arrays_key = None
+
+    def _refresh_sensor_arrays(self) -> None:
+        """
+        Rebuilds the structure-of-arrays view of the sensors if it is stale.
+
+        The view is keyed on the number of sensors and on `BasicSensor`'s modification count, so sensors added
+        with `add_sensor` or appended to `sensors` directly and sensors changed through their setters are picked
+        up without scanning every sensor on each check. Boresights are used as given, as `BasicSensor` does.
+        """
+
+        key = (len(self.sensors), BasicSensor._modification_count)
+        if key == self._sensor_arrays_key:
+            return
+        self._sensor_arrays_key = key
+        self._sensor_array_sensors = np.array(self.sensors, dtype=object)
+        self._sensor_boresights_body = np.array([sensor.boresight_unit_vector for sensor in self.sensors], dtype=np.float64).reshape(-1, 3)
+        self._sensor_cos_sun_exclusion_angles = np.cos(np.deg2rad([sensor.sun_exclusion_angle_deg for sensor in self.sensors]))
+        self._sensor_cos_earth_exclusion_angles = np.cos(np.deg2rad([sensor.earth_exclusion_angle_deg for sensor in self.sensors]))
+
+    def _sensor_names_where(self, mask: np.ndarray) -> list[str]:
+        """
+        Returns the names of the sensors selected by a boolean mask over the sensor arrays, reading only the selected sensors.
+
+        Args:
+            mask (np.ndarray): A boolean array with one entry per sensor.
+
+        Returns:
+            list[str]: The names of the selected sensors, in the order they were added.
+        """
+
+        return [sensor.name for sensor in self._sensor_array_sensors[mask]]
 
-    def check_sensor_sun_exclusion_zones(self, reference_frame: Optional[str] = "GCRS", body_to_reference_frame: Optional[R] = None) -> list[str]:
+    def _body_to_frame_matrix(self, reference_frame: str, body_to_reference_frame: Optional[Union[R, np.ndarray]]) -> np.ndarray:
+        """
+        Resolves the body to reference frame rotation matrix for a sensor check.
+
+        Args:
+            reference_frame (str): The reference frame in which to check exclusion zones.
+            body_to_reference_frame (Optional[Union[R, np.ndarray]]): The caller-supplied rotation, used for frames with no stored attitude.
+
+        Returns:
+            np.ndarray: The (3, 3) rotation matrix from body to reference frame.
+        """
+
+        matrix_getter, _, _ = _SENSOR_FRAME_HANDLERS[reference_frame]
+        if matrix_getter is None:
+            return rotation_to_matrix(body_to_reference_frame)
+        return getattr(self, matrix_getter)()
+
+    def _sensors_violating_exclusion_zones(self, body_to_frame_matrix: np.ndarray, exclusion_vector: np.ndarray, cos_exclusion_angles: np.ndarray) -> list[str]:
+        """
+        Finds the sensors whose boresight is within their exclusion angle of a vector, checking all sensors at once.
+
+        Args:
+            body_to_frame_matrix (np.ndarray): The (3, 3) rotation matrix from body to reference frame.
+            exclusion_vector (np.ndarray): The vector to the excluded object in the reference frame.
+            cos_exclusion_angles (np.ndarray): The cosine of each sensor's exclusion angle.
+
+        Returns:
+            list[str]: A list of sensor names that have their exclusion zones violated.
+        """
+
+        exclusion_unit_vector_body = unit_vector(body_to_frame_matrix.T @ exclusion_vector)
+        violated = self._sensor_boresights_body @ exclusion_unit_vector_body > cos_exclusion_angles
+        return self._sensor_names_where(violated)
+
+    def check_sensor_sun_exclusion_zones(self, reference_frame: Optional[str] = "GCRS", body_to_reference_frame: Optional[Union[R, np.ndarray]] = None) -> list[str]:
         """
         Checks which sensors on the spacecraft have their sun exclusion zones violated in the specified reference frame.
 
         Args:
             reference_frame (Optional[str]): The reference frame in which to check exclusion zones. Defaults to "GCRS".
-            body_to_reference_frame (Optional[R]): A rotation object specifying the spacecraft body to the specified reference frame transformation.
+            body_to_reference_frame (Optional[Union[R, np.ndarray]]): A rotation object or (3, 3) matrix specifying the spacecraft body to the specified reference frame transformation.
 
         Returns:
             list[str]: A list of sensor names that have their sun exclusion zones violated.
@@ -148,36 +242,26 @@ class Spacecraft(OrbitalObject):
         """
         
         # Argument checking
-        if not isinstance(reference_frame, str):
-            raise TypeError(f"arg 'reference_frame' must be of type str, not {type(reference_frame)}")
-        if reference_frame not in ["GCRS", "TEME", "LVLH"]:
-            raise ValueError(f"'reference_frame' must be one of ['GCRS', 'TEME', 'LVLH'] (gave {reference_frame}")
+        if __debug__:
+            require_type("reference_frame", reference_frame, str)
+        if reference_frame not in _SENSOR_FRAME_HANDLERS:
+            raise ValueError(f"'reference_frame' must be one of ['GCRS', 'TEME', 'LVLH'] (gave {reference_frame})")
 
-        sun_exclusion_zones = []
-        
-        match reference_frame:
-            case "GCRS":
-                for sensor in self.sensors:
-                    if sensor.sun_exclusion_zone_violated(self.get_body_to_gcrs_rotation(), self.spacecraft_sun_vector_gcrs):
-                        sun_exclusion_zones.append(sensor.name)
-            case "TEME":
-                for sensor in self.sensors:
-                    if sensor.sun_exclusion_zone_violated(body_to_reference_frame, self.spacecraft_sun_vector_teme):
-                        sun_exclusion_zones.append(sensor.name)
-            case "LVLH":
-                for sensor in self.sensors:
-                    if sensor.sun_exclusion_zone_violated(self.get_body_to_lvlh_rotation(), self.spacecraft_sun_vector_lvlh):
-                        sun_exclusion_zones.append(sensor.name)
-        
-        return sun_exclusion_zones
+        if not self.sensors:
+            return []
+        self._refresh_sensor_arrays()
+
+        _, sun_vector_property, _ = _SENSOR_FRAME_HANDLERS[reference_frame]
+        body_to_frame_matrix = self._body_to_frame_matrix(reference_frame, body_to_reference_frame)
+        return self._sensors_violating_exclusion_zones(body_to_frame_matrix, getattr(self, sun_vector_property), self._sensor_cos_sun_exclusion_angles)
 
-    def check_sensor_earth_exclusion_zones(self, reference_frame: Optional[str] = "TEME", body_to_reference_frame: Optional[R] = None) -> list[str]:
+    def check_sensor_earth_exclusion_zones(self, reference_frame: Optional[str] = "TEME", body_to_reference_frame: Optional[Union[R, np.ndarray]] = None) -> list[str]:
         """
         Checks which sensors on the spacecraft have their earth exclusion zones violated in the specified reference frame.
 
         Args:
             reference_frame (Optional[str]): The reference frame in which to check exclusion zones. Defaults to "TEME".
-            body_to_reference_frame (Optional[R]): A rotation object specifying the spacecraft body to the specified reference frame transformation.
+            body_to_reference_frame (Optional[Union[R, np.ndarray]]): A rotation object or (3, 3) matrix specifying the spacecraft body to the specified reference frame transformation.
 
         Returns:
             list[str]: A list of sensor names that have their earth exclusion zones violated.
@@ -188,36 +272,26 @@ class Spacecraft(OrbitalObject):
         """
         
         # Argument checking
-        if not isinstance(reference_frame, str):
-            raise TypeError(f"arg 'reference_frame' must be of type str, not {type(reference_frame)}")
-        if reference_frame not in ["GCRS", "TEME", "LVLH"]:
-            raise ValueError(f"'reference_frame' must be one of ['GCRS', 'TEME', 'LVLH'] (gave {reference_frame}")
+        if __debug__:
+            require_type("reference_frame", reference_frame, str)
+        if reference_frame not in _SENSOR_FRAME_HANDLERS:
+            raise ValueError(f"'reference_frame' must be one of ['GCRS', 'TEME', 'LVLH'] (gave {reference_frame})")
         
-        earth_exclusion_zones = []
-
-        match reference_frame:
-            case "GCRS":
-                for sensor in self.sensors:
-                    if sensor.earth_exclusion_zone_violated(self.get_body_to_gcrs_rotation(), self.spacecraft_earth_vector_gcrs):
-                        earth_exclusion_zones.append(sensor.name)
-            case "TEME":
-                for sensor in self.sensors:
-                    if sensor.earth_exclusion_zone_violated(body_to_reference_frame, self.spacecraft_earth_vector_teme):
-                        earth_exclusion_zones.append(sensor.name)
-            case "LVLH":
-                for sensor in self.sensors:
-                    if sensor.earth_exclusion_zone_violated(self.get_body_to_lvlh_rotation(), self.spacecraft_earth_vector_lvlh):
-                        earth_exclusion_zones.append(sensor.name)
-
-        return earth_exclusion_zones
-
-    def check_sensor_sun_and_earth_exclusion_zones(self, reference_frame: Optional[str] = "GCRS", body_to_reference_frame: Optional[R] = None) -> tuple[list[str], list[str]]:
+        if not self.sensors:
+            return []
+        self._refresh_sensor_arrays()
+
+        _, _, earth_vector_property = _SENSOR_FRAME_HANDLERS[reference_frame]
+        body_to_frame_matrix = self._body_to_frame_matrix(reference_frame, body_to_reference_frame)
+        return self._sensors_violating_exclusion_zones(body_to_frame_matrix, getattr(self, earth_vector_property), self._sensor_cos_earth_exclusion_angles)
+
+    def check_sensor_sun_and_earth_exclusion_zones(self, reference_frame: Optional[str] = "GCRS", body_to_reference_frame: Optional[Union[R, np.ndarray]] = None) -> tuple[list[str], list[str]]:
         """
         Checks which sensors on the spacecraft have either their sun or earth exclusion zones violated in the specified reference frame.
 
         Args:
             reference_frame (Optional[str]): The reference frame in which to check exclusion zones. Defaults to "GCRS".
-            body_to_reference_frame (Optional[R]): A rotation object specifying the spacecraft body to the specified reference frame transformation.
+            body_to_reference_frame (Optional[Union[R, np.ndarray]]): A rotation object or (3, 3) matrix specifying the spacecraft body to the specified reference frame transformation.
 
         Returns:
             tuple[list[str], list[str]]: Two lists containing the names of sensors that have their sun and earth exclusion zones violated, respectively.
@@ -228,39 +302,76 @@ class Spacecraft(OrbitalObject):
         """
         
         # Argument checking
-        if not isinstance(reference_frame, str):
-            raise TypeError(f"arg 'reference_frame' must be of type str, not {type(reference_frame)}")
-        if reference_frame not in ["GCRS", "TEME", "LVLH"]:
-            raise ValueError(f"'reference_frame' must be one of ['GCRS', 'TEME', 'LVLH'] (gave {reference_frame}")
+        if __debug__:
+            require_type("reference_frame", reference_frame, str)
+        if reference_frame not in _SENSOR_FRAME_HANDLERS:
+            raise ValueError(f"'reference_frame' must be one of ['GCRS', 'TEME', 'LVLH'] (gave {reference_frame})")
 
-        sun_exclusion_zones = []
-        earth_exclusion_zones = []
+        if not self.sensors:
+            return [], []
+        self._refresh_sensor_arrays()
 
-        if reference_frame == "TEME":
-            sun_exclusion_zones = self.check_sensor_sun_exclusion_zones(reference_frame, body_to_reference_frame)
-            earth_exclusion_zones = self.check_sensor_earth_exclusion_zones(reference_frame, body_to_reference_frame)
-        
-        sun_exclusion_zones = self.check_sensor_sun_exclusion_zones(reference_frame)
-        earth_exclusion_zones = self.check_sensor_earth_exclusion_zones(reference_frame)
+        _, sun_vector_property, earth_vector_property = _SENSOR_FRAME_HANDLERS[reference_frame]
+        body_to_frame_matrix = self._body_to_frame_matrix(reference_frame, body_to_reference_frame)
+        sun_vector, earth_vector = getattr(self, sun_vector_property), getattr(self, earth_vector_property)
+
+        # Rotate both vectors into the body frame together and check every sensor against both in one pass
+        sun_vector_body, earth_vector_body = np.vstack((sun_vector, earth_vector)) @ body_to_frame_matrix
+        cos_angles = self._sensor_boresights_body @ np.column_stack((unit_vector(sun_vector_body), unit_vector(earth_vector_body)))
+        sun_exclusion_zones = self._sensor_names_where(cos_angles[:, 0] > self._sensor_cos_sun_exclusion_angles)
+        earth_exclusion_zones = self._sensor_names_where(cos_angles[:, 1] > self._sensor_cos_earth_exclusion_angles)
 
         return sun_exclusion_zones, earth_exclusion_zones
 
     # Rotation things
 
-    def set_body_to_gcrs_rotation(self, body_to_gcrs_rotation: R) -> None:
+    def set_body_to_gcrs_rotation(self, body_to_gcrs_rotation: Union[R, np.ndarray]) -> None:
         """
         Sets the rotation from the spacecraft body frame to the Geocentric Celestial Reference System (GCRS) frame.
 
+        The rotation is stored as a read-only copy in a contiguous float64 (3, 3) matrix, so sensor checks are plain
+        matrix-vector products and later changes to the caller's array cannot leave the cached LVLH attitude stale.
+
         Args:
-            body_to_gcrs_rotation (R): A scipy Rotation object representing the rotation from body to GCRS frame.
+            body_to_gcrs_rotation (Union[R, np.ndarray]): A scipy Rotation object or (3, 3) matrix representing the rotation from body to GCRS frame.
 
         Raises:
-            TypeError: If `body_to_gcrs_rotation` is not an instance of scipy's Rotation class.
+            TypeError: If `body_to_gcrs_rotation` is neither a scipy Rotation nor a numpy array.
+            ValueError: If `body_to_gcrs_rotation` is a matrix not of shape (3, 3).
         """
 
-        if not isinstance(body_to_gcrs_rotation, R):
-            raise TypeError(f"arg 'body_to_gcrs_rotation' must be of type R, not {type(body_to_gcrs_rotation)}")
-        self.body_to_gcrs_rotation = body_to_gcrs_rotation
+        body_to_gcrs_matrix = np.array(rotation_to_matrix(body_to_gcrs_rotation), dtype=np.float64, order="C", copy=True)
+        body_to_gcrs_matrix.flags.writeable = False
+        self._body_to_gcrs_matrix = body_to_gcrs_matrix
+        self._body_to_lvlh_matrix = None
+
+    @property
+    def body_to_gcrs_rotation(self) -> Optional[R]:
+        """
+        The spacecraft's rotation from body frame to GCRS frame, or None if it has not been set. Read-only; use `set_body_to_gcrs_rotation`.
+
+        Returns:
+            Optional[R]: A scipy Rotation object representing the rotation from body to GCRS frame.
+        """
+
+        if self._body_to_gcrs_matrix is None:
+            return None
+        return R.from_matrix(self._body_to_gcrs_matrix)
+
+    def get_body_to_gcrs_matrix(self) -> np.ndarray:
+        """
+        Retrieves the spacecraft's rotation matrix from body frame to GCRS frame.
+
+        Returns:
+            np.ndarray: A (3, 3) matrix representing the rotation from body to GCRS frame.
+
+        Raises:
+            AttributeError: If the body to GCRS rotation has not been set.
+        """
+
+        if self._body_to_gcrs_matrix is None:
+            raise AttributeError(f"body to GCRS rotation of Spacecraft '{self.name}' has not yet been set.")
+        return self._body_to_gcrs_matrix
 
     def get_body_to_gcrs_rotation(self) -> R:
         """
@@ -273,9 +384,24 @@ class Spacecraft(OrbitalObject):
             AttributeError: If the body to GCRS rotation has not been set.
         """
 
-        if self.body_to_gcrs_rotation is None:
-            raise AttributeError(f"attribute 'self.body_to_gcrs_rotation' of Spacecraft '{self.name}' has not yet been set.")
-        return self.body_to_gcrs_rotation
+        return R.from_matrix(self.get_body_to_gcrs_matrix())
+
+    def get_body_to_lvlh_matrix(self) -> np.ndarray:
+        """
+        Computes and retrieves the spacecraft's rotation matrix from body frame to Local Vertical Local Horizontal (LVLH) frame.
+
+        Computed once per epoch and attitude, then cached.
+
+        Returns:
+            np.ndarray: A (3, 3) matrix representing the rotation from body to LVLH frame.
+
+        Raises:
+            AttributeError: If the body to GCRS rotation has not been set.
+        """
+
+        if self._body_to_lvlh_matrix is None:
+            self._body_to_lvlh_matrix = self.gcrs_to_lvlh_matrix @ self.get_body_to_gcrs_matrix()
+        return self._body_to_lvlh_matrix
 
     def get_body_to_lvlh_rotation(self) -> R:
         """
@@ -288,7 +414,4 @@ class Spacecraft(OrbitalObject):
             AttributeError: If the body to GCRS rotation has not been set.
         """
 
-        if self.body_to_gcrs_rotation is None:
-            raise AttributeError(f"attribute 'self.body_to_gcrs_rotation' of Spacecraft '{self.name}' has not yet been set.")
-        gcrs_to_lvlh_rotation_obj = gcrs_to_lvlh_rotation(self.position_vector_gcrs, self.velocity_vector_gcrs)
-        return self.body_to_gcrs_rotation * gcrs_to_lvlh_rotation_obj
+        return R.from_matrix(self.get_body_to_lvlh_matrix())
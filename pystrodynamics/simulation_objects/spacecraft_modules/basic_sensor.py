@@ -1,12 +1,34 @@
 # Standard library imports
+import math
+from typing import Optional, Union
 
 # Third part imports
 import numpy as np
 from scipy.spatial.transform import Rotation as R
 
 # Local imports
+from pystrodynamics.utils.argument_checking import require_type
 from pystrodynamics.simulation_objects.spacecraft_modules.spacecraft_module import SpacecraftModule
-from pystrodynamics.utils.math import angle_between_vectors, norm
+from pystrodynamics.utils.math import angle_between_vectors
+from pystrodynamics.utils.rotations import rotation_to_matrix
+
+def _within_cone(cos_angle_times_range: float, range_squared: float, cos_half_angle: float) -> bool:
+    """
+    Tests whether a vector is within a cone about a unit axis, without a square root or any trigonometry.
+
+    Equivalent to `angle < half_angle`, i.e. `axis.v > |v| cos(half_angle)`, squared on whichever side keeps the signs known.
+
+    Args:
+        cos_angle_times_range (float): The dot product of the cone's unit axis with the vector.
+        range_squared (float): The dot product of the vector with itself.
+        cos_half_angle (float): The cosine of the cone's half angle.
+
+    Returns:
+        bool: True if the vector is strictly within the cone, False otherwise.
+    """
+    if cos_half_angle >= 0.0:
+        return cos_angle_times_range > 0.0 and cos_angle_times_range * cos_angle_times_range > cos_half_angle * cos_half_angle * range_squared
+    return cos_angle_times_range >= 0.0 or cos_angle_times_range * cos_angle_times_range < cos_half_angle * cos_half_angle * range_squared
 
 class BasicSensor(SpacecraftModule):
     """
@@ -21,6 +43,10 @@ class BasicSensor(SpacecraftModule):
         field_of_view_half_angle_deg (float): Half the angle of the sensor's field of view in degrees.
     """
 
+    # Bumped whenever any sensor's boresight, exclusion angles, range or field of view changes, so holders of
+    # views derived from sensors (e.g. Spacecraft's sensor arrays) can tell they are stale without scanning them
+    _modification_count = 0
+
     def __init__(self,
                  name: str,
                  boresight_unit_vector: np.ndarray,
@@ -43,32 +69,171 @@ class BasicSensor(SpacecraftModule):
             TypeError: If any argument is not of the expected type.
         """
 
-        # Argument checking
-        if not isinstance(boresight_unit_vector, np.ndarray):
-            raise TypeError(f"arg 'boresight_unit_vector' must be of type np.ndarray, not {type(boresight_unit_vector)}")
-        if not isinstance(sun_exclusion_angle_deg, float):
-            raise TypeError(f"arg 'sun_exclusion_angle_deg' must be of type float, not {type(sun_exclusion_angle_deg)}")
-        if not isinstance(earth_exclusion_angle_deg, float):
-            raise TypeError(f"arg 'earth_exclusion_angle_deg' must be of type float, not {type(earth_exclusion_angle_deg)}")
-        if not isinstance(effective_range_km, float):
-            raise TypeError(f"arg 'effective_range_km' must be of type float, not {type(effective_range_km)}")
-        if not isinstance(field_of_view_half_angle_deg, float):
-            raise TypeError(f"arg 'field_of_view_half_angle_deg' must be of type float, not {type(field_of_view_half_angle_deg)}")
-        
         super().__init__(name)
 
+        self._body_to_frame_rotation = None
+        self._body_to_frame_matrix = None
+        self._boresight_unit_vector_in_frame = None
+        # Last Rotation passed directly to a check, kept apart from the frame given to `set_frame`
+        self._call_rotation = None
+        self._call_boresight_unit_vector_in_frame = None
+
+        # Assigned through the property setters, which check the types and cache the derived values
         self.boresight_unit_vector = boresight_unit_vector
         self.sun_exclusion_angle_deg = sun_exclusion_angle_deg
         self.earth_exclusion_angle_deg = earth_exclusion_angle_deg
         self.effective_range_km = effective_range_km
         self.field_of_view_half_angle_deg = field_of_view_half_angle_deg
 
-    def target_angle_from_boresight(self, body_to_frame_rotation: R, target_vector: np.ndarray) -> float:
+    @property
+    def boresight_unit_vector(self) -> np.ndarray:
+        """The unit vector along the sensor's boresight, in the body frame. Read-only; assign a new vector to change it."""
+        return self._boresight_unit_vector
+
+    @boresight_unit_vector.setter
+    def boresight_unit_vector(self, boresight_unit_vector: np.ndarray) -> None:
+        if __debug__:
+            require_type("boresight_unit_vector", boresight_unit_vector, np.ndarray)
+        boresight_unit_vector = np.array(boresight_unit_vector, dtype=np.float64, order="C", copy=True)
+        boresight_unit_vector.flags.writeable = False
+        self._boresight_unit_vector = boresight_unit_vector
+
+        # Re-rotate into the frame given to `set_frame`, and forget the boresight rotated for the last call
+        if self._body_to_frame_matrix is not None:
+            self._boresight_unit_vector_in_frame = self._body_to_frame_matrix @ boresight_unit_vector
+        self._call_rotation = None
+        self._call_boresight_unit_vector_in_frame = None
+        BasicSensor._modification_count += 1
+
+    @property
+    def sun_exclusion_angle_deg(self) -> float:
+        """The minimum angle from the boresight within which the Sun must not be detected, in degrees."""
+        return self._sun_exclusion_angle_deg
+
+    @sun_exclusion_angle_deg.setter
+    def sun_exclusion_angle_deg(self, sun_exclusion_angle_deg: float) -> None:
+        if __debug__:
+            require_type("sun_exclusion_angle_deg", sun_exclusion_angle_deg, float)
+        self._sun_exclusion_angle_deg = sun_exclusion_angle_deg
+        self._cos_sun_exclusion_angle = math.cos(math.radians(sun_exclusion_angle_deg))
+        BasicSensor._modification_count += 1
+
+    @property
+    def earth_exclusion_angle_deg(self) -> float:
+        """The minimum angle from the boresight within which the Earth must not be detected, in degrees."""
+        return self._earth_exclusion_angle_deg
+
+    @earth_exclusion_angle_deg.setter
+    def earth_exclusion_angle_deg(self, earth_exclusion_angle_deg: float) -> None:
+        if __debug__:
+            require_type("earth_exclusion_angle_deg", earth_exclusion_angle_deg, float)
+        self._earth_exclusion_angle_deg = earth_exclusion_angle_deg
+        self._cos_earth_exclusion_angle = math.cos(math.radians(earth_exclusion_angle_deg))
+        BasicSensor._modification_count += 1
+
+    @property
+    def effective_range_km(self) -> float:
+        """The maximum distance (in kilometers) from the sensor within which a target can be detected."""
+        return self._effective_range_km
+
+    @effective_range_km.setter
+    def effective_range_km(self, effective_range_km: float) -> None:
+        if __debug__:
+            require_type("effective_range_km", effective_range_km, float)
+        self._effective_range_km = effective_range_km
+        self._effective_range_km_squared = effective_range_km * effective_range_km
+        BasicSensor._modification_count += 1
+
+    @property
+    def field_of_view_half_angle_deg(self) -> float:
+        """Half the angle of the sensor's field of view in degrees."""
+        return self._field_of_view_half_angle_deg
+
+    @field_of_view_half_angle_deg.setter
+    def field_of_view_half_angle_deg(self, field_of_view_half_angle_deg: float) -> None:
+        if __debug__:
+            require_type("field_of_view_half_angle_deg", field_of_view_half_angle_deg, float)
+        self._field_of_view_half_angle_deg = field_of_view_half_angle_deg
+        self._cos_field_of_view_half_angle = math.cos(math.radians(field_of_view_half_angle_deg))
+        BasicSensor._modification_count += 1
+
+    def set_frame(self, body_to_frame_rotation: Union[R, np.ndarray]) -> None:
+        """
+        Rotates the sensor's boresight into a reference frame once, for reuse across many target checks at the same epoch.
+
+        A scipy Rotation is converted to a matrix here and remembered, so passing the same Rotation object to the
+        per-target checks does not convert it again.
+
+        Args:
+            body_to_frame_rotation (Union[R, np.ndarray]): The rotation or (3, 3) matrix from body to reference frame.
+
+        Raises:
+            TypeError: If `body_to_frame_rotation` is neither a scipy Rotation nor a numpy array.
+        """
+        # Argument checking
+        if __debug__:
+            require_type("body_to_frame_rotation", body_to_frame_rotation, (R, np.ndarray))
+
+        self._body_to_frame_rotation = body_to_frame_rotation if isinstance(body_to_frame_rotation, R) else None
+        self._body_to_frame_matrix = rotation_to_matrix(body_to_frame_rotation)
+        self._boresight_unit_vector_in_frame = self._body_to_frame_matrix @ self.boresight_unit_vector
+
+    def _resolve_boresight_unit_vector_in_frame(self, body_to_frame_rotation: Optional[Union[R, np.ndarray]]) -> np.ndarray:
+        """
+        Gets the boresight in the reference frame, rotating it first if a rotation other than a cached one is given.
+
+        A rotation passed here never replaces the frame given to `set_frame`; the last scipy Rotation passed is
+        remembered separately, so repeated checks with the same Rotation object do not convert it again.
+
+        Args:
+            body_to_frame_rotation (Optional[Union[R, np.ndarray]]): The rotation or (3, 3) matrix from body to reference frame, 
+                or None to reuse the frame last given to `set_frame`.
+
+        Returns:
+            np.ndarray: The boresight unit vector in the reference frame.
+
+        Raises:
+            ValueError: If `body_to_frame_rotation` is None and `set_frame` has not been called.
+        """
+
+        if body_to_frame_rotation is None:
+            if self._boresight_unit_vector_in_frame is None:
+                raise ValueError(f"no reference frame has been set for BasicSensor '{self.name}'; call set_frame first.")
+            return self._boresight_unit_vector_in_frame
+        if body_to_frame_rotation is self._body_to_frame_rotation:
+            return self._boresight_unit_vector_in_frame
+        if body_to_frame_rotation is self._call_rotation:
+            return self._call_boresight_unit_vector_in_frame
+
+        boresight_unit_vector_in_frame = rotation_to_matrix(body_to_frame_rotation) @ self.boresight_unit_vector
+        # Arrays can be changed in place, so only a Rotation is safe to recognise by identity
+        if isinstance(body_to_frame_rotation, R):
+            self._call_rotation = body_to_frame_rotation
+            self._call_boresight_unit_vector_in_frame = boresight_unit_vector_in_frame
+        return boresight_unit_vector_in_frame
+
+    def _vector_within_cone(self, body_to_frame_rotation: Union[R, np.ndarray], vector: np.ndarray, cos_half_angle: float) -> bool:
+        """
+        Determines if a vector is strictly within a cone of the given half angle about the boresight.
+
+        Args:
+            body_to_frame_rotation (Union[R, np.ndarray]): The rotation or (3, 3) matrix from body to reference frame.
+            vector (np.ndarray): The vector to test in the reference frame.
+            cos_half_angle (float): The cosine of the cone's half angle.
+
+        Returns:
+            bool: True if the angle between the boresight and the vector is below the half angle, False otherwise.
+        """
+
+        boresight_unit_vector_in_frame = self._resolve_boresight_unit_vector_in_frame(body_to_frame_rotation)
+        return _within_cone(float(np.dot(boresight_unit_vector_in_frame, vector)), float(np.dot(vector, vector)), cos_half_angle)
+
+    def target_angle_from_boresight(self, body_to_frame_rotation: Union[R, np.ndarray], target_vector: np.ndarray) -> float:
         """
         Calculates the angle between the sensor's boresight and a target vector.
 
         Args:
-            body_to_frame_rotation (R): The rotation from body to reference frame.
+            body_to_frame_rotation (Union[R, np.ndarray]): The rotation or (3, 3) matrix from body to reference frame.
             target_vector (np.ndarray): The vector to the target in the reference frame.
 
         Returns:
@@ -78,20 +243,19 @@ class BasicSensor(SpacecraftModule):
             TypeError: If any argument is not of the expected type.
         """
         # Argument checking
-        if not isinstance(body_to_frame_rotation, R):
-            raise TypeError(f"arg 'body_to_frame_rotation' must be of type R, not {type(body_to_frame_rotation)}")
-        if not isinstance(target_vector, R):
-            raise TypeError(f"arg 'target_vector' must be of type np.ndarray, not {type(target_vector)}")
+        if __debug__:
+            require_type("body_to_frame_rotation", body_to_frame_rotation, (R, np.ndarray))
+            require_type("target_vector", target_vector, np.ndarray)
         
-        boresight_unit_vector_in_frame = body_to_frame_rotation.apply(self.boresight_unit_vector)
+        boresight_unit_vector_in_frame = self._resolve_boresight_unit_vector_in_frame(body_to_frame_rotation)
         return angle_between_vectors(boresight_unit_vector_in_frame, target_vector, "degrees")
 
-    def exclusion_zone_violated(self, body_to_frame_rotation: R, exclusion_vector: np.ndarray, exclusion_angle: float) -> bool:
+    def exclusion_zone_violated(self, body_to_frame_rotation: Union[R, np.ndarray], exclusion_vector: np.ndarray, exclusion_angle: float) -> bool:
         """
         Determines if the target violates a specified exclusion zone.
 
         Args:
-            body_to_frame_rotation (R): The rotation from body to reference frame.
+            body_to_frame_rotation (Union[R, np.ndarray]): The rotation or (3, 3) matrix from body to reference frame.
             exclusion_vector (np.ndarray): The vector to the object to check against the exclusion zone.
             exclusion_angle (float): The angle defining the exclusion zone.
 
@@ -102,21 +266,19 @@ class BasicSensor(SpacecraftModule):
             TypeError: If any argument is not of the expected type.
         """
         # Argument checking
-        if not isinstance(body_to_frame_rotation, R):
-            raise TypeError(f"arg 'body_to_frame_rotation' must be of type R, not {type(body_to_frame_rotation)}")
-        if not isinstance(exclusion_vector, R):
-            raise TypeError(f"arg 'exclusion_vector' must be of type np.ndarray, not {type(exclusion_vector)}")
-        if not isinstance(exclusion_angle, R):
-            raise TypeError(f"arg 'exclusion_angle' must be of type float, not {type(exclusion_angle)}")
+        if __debug__:
+            require_type("body_to_frame_rotation", body_to_frame_rotation, (R, np.ndarray))
+            require_type("exclusion_vector", exclusion_vector, np.ndarray)
+            require_type("exclusion_angle", exclusion_angle, float)
         
-        return self.target_angle_from_boresight(body_to_frame_rotation, exclusion_vector) < exclusion_angle
+        return self._vector_within_cone(body_to_frame_rotation, exclusion_vector, math.cos(math.radians(exclusion_angle)))
 
-    def earth_exclusion_zone_violated(self, body_to_frame_rotation: R, spacecraft_to_earth_vector: np.ndarray) -> bool:
+    def earth_exclusion_zone_violated(self, body_to_frame_rotation: Union[R, np.ndarray], spacecraft_to_earth_vector: np.ndarray) -> bool:
         """
         Determines if the Earth violates the sensor's Earth exclusion zone.
 
         Args:
-            body_to_frame_rotation (R): The rotation from body to reference frame.
+            body_to_frame_rotation (Union[R, np.ndarray]): The rotation or (3, 3) matrix from body to reference frame.
             spacecraft_to_earth_vector (np.ndarray): The vector from the spacecraft to Earth in the reference frame.
 
         Returns:
@@ -126,19 +288,18 @@ class BasicSensor(SpacecraftModule):
             TypeError: If any argument is not of the expected type.
         """
         # Argument checking
-        if not isinstance(body_to_frame_rotation, R):
-            raise TypeError(f"arg 'body_to_frame_rotation' must be of type R, not {type(body_to_frame_rotation)}")
-        if not isinstance(spacecraft_to_earth_vector, R):
-            raise TypeError(f"arg 'spacecraft_to_earth_vector' must be of type np.ndarray, not {type(spacecraft_to_earth_vector)}")
+        if __debug__:
+            require_type("body_to_frame_rotation", body_to_frame_rotation, (R, np.ndarray))
+            require_type("spacecraft_to_earth_vector", spacecraft_to_earth_vector, np.ndarray)
         
-        return self.exclusion_zone_violated(body_to_frame_rotation, spacecraft_to_earth_vector, self.earth_exclusion_angle_deg)
+        return self._vector_within_cone(body_to_frame_rotation, spacecraft_to_earth_vector, self._cos_earth_exclusion_angle)
     
-    def sun_exclusion_zone_violated(self, body_to_frame_rotation: R, spacecraft_to_sun_vector: np.ndarray) -> bool:
+    def sun_exclusion_zone_violated(self, body_to_frame_rotation: Union[R, np.ndarray], spacecraft_to_sun_vector: np.ndarray) -> bool:
         """
         Determines if the Sun violates the sensor's Sun exclusion zone.
 
         Args:
-            body_to_frame_rotation (R): The rotation from body to reference frame.
+            body_to_frame_rotation (Union[R, np.ndarray]): The rotation or (3, 3) matrix from body to reference frame.
             spacecraft_to_sun_vector (np.ndarray): The vector from the spacecraft to the Sun in the reference frame.
 
         Returns:
@@ -148,19 +309,18 @@ class BasicSensor(SpacecraftModule):
             TypeError: If any argument is not of the expected type.
         """
         # Argument checking
-        if not isinstance(body_to_frame_rotation, R):
-            raise TypeError(f"arg 'body_to_frame_rotation' must be of type R, not {type(body_to_frame_rotation)}")
-        if not isinstance(spacecraft_to_sun_vector, R):
-            raise TypeError(f"arg 'spacecraft_to_sun_vector' must be of type np.ndarray, not {type(spacecraft_to_sun_vector)}")
+        if __debug__:
+            require_type("body_to_frame_rotation", body_to_frame_rotation, (R, np.ndarray))
+            require_type("spacecraft_to_sun_vector", spacecraft_to_sun_vector, np.ndarray)
         
-        return self.exclusion_zone_violated(body_to_frame_rotation, spacecraft_to_sun_vector, self.sun_exclusion_angle_deg)
+        return self._vector_within_cone(body_to_frame_rotation, spacecraft_to_sun_vector, self._cos_sun_exclusion_angle)
 
-    def target_in_field_of_view(self, body_to_frame_rotation: R, spacecraft_to_target_vector: np.ndarray) -> bool:
+    def target_in_field_of_view(self, body_to_frame_rotation: Union[R, np.ndarray], spacecraft_to_target_vector: np.ndarray) -> bool:
         """
         Determines if a target is within the sensor's field of view.
 
         Args:
-            body_to_frame_rotation (R): The rotation from body to reference frame.
+            body_to_frame_rotation (Union[R, np.ndarray]): The rotation or (3, 3) matrix from body to reference frame.
             spacecraft_to_target_vector (np.ndarray): The vector from the spacecraft to the target in the reference frame.
 
         Returns:
@@ -170,12 +330,11 @@ class BasicSensor(SpacecraftModule):
             TypeError: If any argument is not of the expected type.
         """
         # Argument checking
-        if not isinstance(body_to_frame_rotation, R):
-            raise TypeError(f"arg 'body_to_frame_rotation' must be of type R, not {type(body_to_frame_rotation)}")
-        if not isinstance(spacecraft_to_target_vector, R):
-            raise TypeError(f"arg 'spacecraft_to_target_vector' must be of type np.ndarray, not {type(spacecraft_to_target_vector)}")
+        if __debug__:
+            require_type("body_to_frame_rotation", body_to_frame_rotation, (R, np.ndarray))
+            require_type("spacecraft_to_target_vector", spacecraft_to_target_vector, np.ndarray)
         
-        return self.target_angle_from_boresight(body_to_frame_rotation, spacecraft_to_target_vector) < self.field_of_view_half_angle_deg
+        return self._vector_within_cone(body_to_frame_rotation, spacecraft_to_target_vector, self._cos_field_of_view_half_angle)
 
     def target_in_range(self, spacecraft_to_target_vector: np.ndarray) -> bool:
         """
@@ -191,17 +350,21 @@ class BasicSensor(SpacecraftModule):
             TypeError: If any argument is not of the expected type.
         """
         # Argument checking
-        if not isinstance(spacecraft_to_target_vector, R):
-            raise TypeError(f"arg 'spacecraft_to_target_vector' must be of type np.ndarray, not {type(spacecraft_to_target_vector)}")
+        if __debug__:
+            require_type("spacecraft_to_target_vector", spacecraft_to_target_vector, np.ndarray)
         
-        return norm(spacecraft_to_target_vector) <= self.effective_range_km
+        return float(np.dot(spacecraft_to_target_vector, spacecraft_to_target_vector)) <= self._effective_range_km_squared
 
-    def target_is_accessible(self, body_to_frame_rotation: R, spacecraft_to_target_vector: np.ndarray) -> bool:
+    def target_is_accessible(self, body_to_frame_rotation: Optional[Union[R, np.ndarray]], spacecraft_to_target_vector: np.ndarray) -> bool:
         """
         Determines if a target is both within the field of view and effective range of the sensor.
 
+        The check is a single dot product against the boresight in the reference frame, compared with the
+        precomputed cosine of the field of view half angle, so no angle is ever evaluated.
+
         Args:
-            body_to_frame_rotation (R): The rotation from body to reference frame.
+            body_to_frame_rotation (Optional[Union[R, np.ndarray]]): The rotation or (3, 3) matrix from body to reference frame, 
+                or None to reuse the frame last given to `set_frame`.
             spacecraft_to_target_vector (np.ndarray): The vector from the spacecraft to the target.
 
         Returns:
@@ -209,11 +372,121 @@ class BasicSensor(SpacecraftModule):
 
         Raises:
             TypeError: If any argument is not of the expected type.
+            ValueError: If `body_to_frame_rotation` is None and `set_frame` has not been called.
+        """
+        # Argument checking
+        if __debug__:
+            require_type("body_to_frame_rotation", body_to_frame_rotation, (R, np.ndarray, type(None)))
+            require_type("spacecraft_to_target_vector", spacecraft_to_target_vector, np.ndarray)
+
+        boresight_unit_vector_in_frame = self._resolve_boresight_unit_vector_in_frame(body_to_frame_rotation)
+        range_squared = float(np.dot(spacecraft_to_target_vector, spacecraft_to_target_vector))
+        if range_squared > self._effective_range_km_squared:
+            return False
+        cos_angle_times_range = float(np.dot(boresight_unit_vector_in_frame, spacecraft_to_target_vector))
+        return _within_cone(cos_angle_times_range, range_squared, self._cos_field_of_view_half_angle)
+
+    def targets_accessible_batch(self, body_to_frame_rotation: Optional[Union[R, np.ndarray]], spacecraft_to_target_vectors: np.ndarray) -> np.ndarray:
+        """
+        Determines which of a batch of targets are both within the field of view and effective range of the sensor.
+
+        Args:
+            body_to_frame_rotation (Optional[Union[R, np.ndarray]]): The rotation or (3, 3) matrix from body to reference frame, 
+                or None to reuse the frame last given to `set_frame`.
+            spacecraft_to_target_vectors (np.ndarray): An (N, 3) array of vectors from the spacecraft to each target.
+
+        Returns:
+            np.ndarray: A boolean array of length N, True where the target is accessible.
+
+        Raises:
+            TypeError: If any argument is not of the expected type.
+            ValueError: If `body_to_frame_rotation` is None and `set_frame` has not been called.
         """
         # Argument checking
-        if not isinstance(body_to_frame_rotation, R):
-            raise TypeError(f"arg 'body_to_frame_rotation' must be of type R, not {type(body_to_frame_rotation)}")
-        if not isinstance(spacecraft_to_target_vector, R):
-            raise TypeError(f"arg 'spacecraft_to_target_vector' must be of type np.ndarray, not {type(spacecraft_to_target_vector)}")
+        if __debug__:
+            require_type("body_to_frame_rotation", body_to_frame_rotation, (R, np.ndarray, type(None)))
+            require_type("spacecraft_to_target_vectors", spacecraft_to_target_vectors, np.ndarray)
+
+        boresight_unit_vector_in_frame = self._resolve_boresight_unit_vector_in_frame(body_to_frame_rotation)
+        ranges_squared = np.einsum("ij,ij->i", spacecraft_to_target_vectors, spacecraft_to_target_vectors)
+        cos_angles_times_ranges = spacecraft_to_target_vectors @ boresight_unit_vector_in_frame
+        in_field_of_view = cos_angles_times_ranges > np.sqrt(ranges_squared) * self._cos_field_of_view_half_angle
+        in_range = ranges_squared <= self._effective_range_km_squared
+        return in_field_of_view & in_range
+
+    def exclusion_mask_batch(self, body_to_frame_rotation: Optional[Union[R, np.ndarray]], exclusion_vectors: np.ndarray, exclusion_angle: float) -> np.ndarray:
+        """
+        Determines which of a batch of vectors violate a specified exclusion zone.
+
+        Args:
+            body_to_frame_rotation (Optional[Union[R, np.ndarray]]): The rotation or (3, 3) matrix from body to reference frame, 
+                or None to reuse the frame last given to `set_frame`.
+            exclusion_vectors (np.ndarray): An (N, 3) array of vectors to the objects to check against the exclusion zone.
+            exclusion_angle (float): The angle defining the exclusion zone, in degrees.
+
+        Returns:
+            np.ndarray: A boolean array of length N, True where the exclusion zone is violated.
 
-        return (self.target_in_field_of_view(body_to_frame_rotation, spacecraft_to_target_vector) and self.target_in_range(spacecraft_to_target_vector))
+        Raises:
+            TypeError: If any argument is not of the expected type.
+            ValueError: If `body_to_frame_rotation` is None and `set_frame` has not been called.
+        """
+        # Argument checking
+        if __debug__:
+            require_type("body_to_frame_rotation", body_to_frame_rotation, (R, np.ndarray, type(None)))
+            require_type("exclusion_vectors", exclusion_vectors, np.ndarray)
+            require_type("exclusion_angle", exclusion_angle, float)
+
+        boresight_unit_vector_in_frame = self._resolve_boresight_unit_vector_in_frame(body_to_frame_rotation)
+        ranges = np.sqrt(np.einsum("ij,ij->i", exclusion_vectors, exclusion_vectors))
+        return exclusion_vectors @ boresight_unit_vector_in_frame > ranges * math.cos(math.radians(exclusion_angle))
+
+    def sensor_access_batch(
+        self,
+        body_to_frame_rotation: Optional[Union[R, np.ndarray]],
+        spacecraft_to_target_vectors: np.ndarray,
+        spacecraft_to_sun_vector: np.ndarray,
+        spacecraft_to_earth_vector: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Determines which of a batch of targets the sensor can observe: accessible, with neither exclusion zone violated.
+
+        The targets, Sun and Earth vectors are dotted with the boresight in one matrix product, and every test is a
+        comparison against a cached cosine or squared range.
+
+        Args:
+            body_to_frame_rotation (Optional[Union[R, np.ndarray]]): The rotation or (3, 3) matrix from body to reference frame, 
+                or None to reuse the frame last given to `set_frame`.
+            spacecraft_to_target_vectors (np.ndarray): An (N, 3) array of vectors from the spacecraft to each target.
+            spacecraft_to_sun_vector (np.ndarray): The vector from the spacecraft to the Sun in the reference frame.
+            spacecraft_to_earth_vector (np.ndarray): The vector from the spacecraft to Earth in the reference frame.
+
+        Returns:
+            np.ndarray: A boolean array of length N, True where the target can be observed.
+
+        Raises:
+            TypeError: If any argument is not of the expected type.
+            ValueError: If `body_to_frame_rotation` is None and `set_frame` has not been called.
+        """
+        # Argument checking
+        if __debug__:
+            require_type("body_to_frame_rotation", body_to_frame_rotation, (R, np.ndarray, type(None)))
+            require_type("spacecraft_to_target_vectors", spacecraft_to_target_vectors, np.ndarray)
+            require_type("spacecraft_to_sun_vector", spacecraft_to_sun_vector, np.ndarray)
+            require_type("spacecraft_to_earth_vector", spacecraft_to_earth_vector, np.ndarray)
+
+        boresight_unit_vector_in_frame = self._resolve_boresight_unit_vector_in_frame(body_to_frame_rotation)
+        vectors = np.vstack((spacecraft_to_target_vectors, spacecraft_to_sun_vector, spacecraft_to_earth_vector))
+        cos_angles_times_ranges = vectors @ boresight_unit_vector_in_frame
+        ranges_squared = np.einsum("ij,ij->i", vectors, vectors)
+
+        # The exclusion zones are per epoch, not per target, so either one blocks the whole batch
+        sun_excluded = _within_cone(float(cos_angles_times_ranges[-2]), float(ranges_squared[-2]), self._cos_sun_exclusion_angle)
+        earth_excluded = _within_cone(float(cos_angles_times_ranges[-1]), float(ranges_squared[-1]), self._cos_earth_exclusion_angle)
+        if sun_excluded or earth_excluded:
+            return np.zeros(len(spacecraft_to_target_vectors), dtype=bool)
+
+        cos_angles_times_ranges = cos_angles_times_ranges[:-2]
+        ranges_squared = ranges_squared[:-2]
+        in_field_of_view = cos_angles_times_ranges > np.sqrt(ranges_squared) * self._cos_field_of_view_half_angle
+        return in_field_of_view & (ranges_squared <= self._effective_range_km_squared)
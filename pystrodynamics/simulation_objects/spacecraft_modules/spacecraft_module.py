@@ -1,32 +1,29 @@
 # Standard library imports
-from abc import ABC, abstractmethod
+from abc import ABC
 
 # Third party imports
 
 # Local imports
+from pystrodynamics.utils.argument_checking import require_type
 
 class SpacecraftModule(ABC):
     def __init__(self, name: str):
         # Argument checking
-        if not isinstance(name, str):
-            raise TypeError(f"arg 'name' must be of type str, not {type(name)}")
+        if __debug__:
+            require_type("name", name, str)
         
         self.name = name
-        self.__power_state = "OFF"
+        self._power_state = "OFF"
 
     @property
     def power_state(self) -> str:
-        return self.__power_state
+        return self._power_state
 
-    @abstractmethod
     def turn_on(self):
-        self.__power_state = "ON"
+        self._power_state = "ON"
 
-    @abstractmethod
     def turn_off(self):
-        self.__power_state = "OFF"
+        self._power_state = "OFF"
 
-    @abstractmethod
     def set_idle(self):
-        self.__power_state = "IDLE"
-
+        self._power_state = "IDLE"
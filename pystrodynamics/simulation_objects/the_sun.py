@@ -5,12 +5,15 @@ from datetime import datetime, timezone
 import numpy as np
 
 # Local imports
+from pystrodynamics.utils.argument_checking import require_type
 from pystrodynamics.simulation_objects.simulation_object import SimulationObject
-from pystrodynamics.utils.sun import get_earth_sun_vector_gcrs_at_epoch, get_earth_sun_vector_teme_at_epoch
+from pystrodynamics.utils.sun import SunVectorInterpolator, get_cached_earth_sun_vector_gcrs_at_epoch, get_cached_earth_sun_vector_teme_at_epoch
 
 class TheSun(SimulationObject):
     """Simulation object for the Sun."""
 
+    __slots__ = ("epoch", "_earth_sun_vector_gcrs", "_earth_sun_vector_teme", "_interpolators")
+
     def __init__(self, name: str, initial_epoch: datetime) -> None:
         """Initializes a TheSun instance.
         
@@ -25,11 +28,33 @@ class TheSun(SimulationObject):
             TypeError: if arguments are not of expected type.
         
         """
-        if not isinstance(initial_epoch, datetime):
-            raise TypeError(f"arg 'initial_epoch' must be of type datetime, not {type(initial_epoch)}")
+        if __debug__:
+            require_type("initial_epoch", initial_epoch, datetime)
         super().__init__(name)
+        self._interpolators = {}
         self.update_state(initial_epoch)
 
+    def attach_interpolator(self, interpolator: SunVectorInterpolator) -> None:
+        """Serves the Earth-Sun vector in the interpolator's frame from the interpolator instead of the ephemeris.
+
+        Args:
+            interpolator (SunVectorInterpolator): a Sun vector interpolator covering the epochs to be simulated.
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: if arguments are not of expected type.
+
+        """
+        if __debug__:
+            require_type("interpolator", interpolator, SunVectorInterpolator)
+        self._interpolators[interpolator.reference_frame] = interpolator
+        if interpolator.reference_frame == "GCRS":
+            self._earth_sun_vector_gcrs = None
+        else:
+            self._earth_sun_vector_teme = None
+
     def update_state(self, epoch: datetime) -> None:
         """Updates the state of the Sun object with information for the new epoch.
 
@@ -43,14 +68,16 @@ class TheSun(SimulationObject):
             TypeError: if arguments are not of expected type.
 
         """
-        if not isinstance(epoch, datetime):
-            raise TypeError(f"arg 'epoch' must be of type datetime, not {type(epoch)}")
+        if __debug__:
+            require_type("epoch", epoch, datetime)
         epoch = epoch.replace(tzinfo=timezone.utc)
         self.epoch = epoch
+        self._earth_sun_vector_gcrs = None
+        self._earth_sun_vector_teme = None
 
     @property
     def earth_sun_vector_gcrs(self) -> np.ndarray:
-        """The vector from the Earth to the Sun in GCRS frame.
+        """The vector from the Earth to the Sun in GCRS frame, looked up once per epoch. Read-only, as it is shared.
 
         Args:
             None
@@ -59,13 +86,20 @@ class TheSun(SimulationObject):
             earth_sun_vector_gcrs (np.ndarray): Earth-Sun vector in GCRS.
 
         """
-        return get_earth_sun_vector_gcrs_at_epoch(self.epoch)
+        if self._earth_sun_vector_gcrs is None:
+            if "GCRS" in self._interpolators:
+                self._earth_sun_vector_gcrs = self._interpolators["GCRS"].earth_sun_vector(self.epoch)
+                self._earth_sun_vector_gcrs.setflags(write=False)
+            else:
+                self._earth_sun_vector_gcrs = get_cached_earth_sun_vector_gcrs_at_epoch(self.epoch)
+        return self._earth_sun_vector_gcrs
 
     @property
     def earth_sun_vector_teme(self) -> np.ndarray:
-        """The vector from the Earth to the Sun in TEME frame.
+        """The vector from the Earth to the Sun in TEME frame, looked up once per epoch. Read-only, as it is shared.
 
-        Note: much slower than earth_sun_vector_gcrs due to the necessary frame transformation.
+        Note: much slower than earth_sun_vector_gcrs due to the necessary frame transformation,
+        unless a TEME interpolator has been attached.
 
         Args:
             None
@@ -74,5 +108,11 @@ class TheSun(SimulationObject):
             earth_sun_vector_teme (np.ndarray): Earth-Sun vector in TEME.
 
         """
-        return get_earth_sun_vector_teme_at_epoch(self.epoch)
+        if self._earth_sun_vector_teme is None:
+            if "TEME" in self._interpolators:
+                self._earth_sun_vector_teme = self._interpolators["TEME"].earth_sun_vector(self.epoch)
+                self._earth_sun_vector_teme.setflags(write=False)
+            else:
+                self._earth_sun_vector_teme = get_cached_earth_sun_vector_teme_at_epoch(self.epoch)
+        return self._earth_sun_vector_teme
 
@@ -0,0 +1,48 @@
+"""Helpers for validating function arguments."""
+
+# Standard library imports
+from typing import Any, Iterable, Union
+
+
+def _type_names(expected_type: Union[type, tuple[type, ...]]) -> str:
+    """Returns the name of a type, or the names of a tuple of types joined with 'or'."""
+    if isinstance(expected_type, tuple):
+        return " or ".join(accepted_type.__name__ for accepted_type in expected_type)
+    return expected_type.__name__
+
+
+def require_type(name: str, value: Any, expected_type: Union[type, tuple[type, ...]]) -> None:
+    """Raises a TypeError unless a value is an instance of the expected type(s).
+
+    Callers invoke this under `if __debug__:` so that argument checking is compiled out under `python -O`.
+
+    Args:
+        name (str): the name of the argument, for the error message.
+        value (Any): the argument value to check.
+        expected_type (Union[type, tuple[type, ...]]): the accepted type, or a tuple of accepted types.
+
+    Raises:
+        TypeError: if `value` is not an instance of `expected_type`.
+
+    """
+    if not isinstance(value, expected_type):
+        raise TypeError(f"arg {name!r} must be of type {_type_names(expected_type)}, not {type(value).__name__}")
+
+
+def require_element_types(name: str, values: Iterable[Any], expected_type: Union[type, tuple[type, ...]]) -> None:
+    """Raises a TypeError unless every element of a collection is an instance of the expected type(s).
+
+    Callers invoke this under `if __debug__:` so that argument checking is compiled out under `python -O`.
+
+    Args:
+        name (str): the name of the argument, for the error message.
+        values (Iterable[Any]): the elements of the argument to check.
+        expected_type (Union[type, tuple[type, ...]]): the accepted type, or a tuple of accepted types.
+
+    Raises:
+        TypeError: if any element of `values` is not an instance of `expected_type`.
+
+    """
+    for value in values:
+        if not isinstance(value, expected_type):
+            raise TypeError(f"elements of arg {name!r} must be of type {_type_names(expected_type)}, not {type(value).__name__}")
@@ -1,2 +1,2 @@
 earth_radius_km = 6378.1366
-sun_radius_km = 695700
\ No newline at end of file
+sun_radius_km = 695700.0
\ No newline at end of file
@@ -1,10 +1,57 @@
 """Functions for checking if Earth-orbiting objects are in the umbra or penumbra of Earth - that is, eclipse."""
 
+import math
+
 import numpy as np
 
-from pystrodynamics.utils.math import norm, angle_between_vectors
+from pystrodynamics.utils.argument_checking import require_type
 from pystrodynamics.utils.constants import sun_radius_km, earth_radius_km
 
+# Numerators k of the umbra and penumbra cone half angles atan(k/d), as plain floats
+_UMBRA_K = float(sun_radius_km - earth_radius_km)
+_PENUMBRA_K = float(sun_radius_km + earth_radius_km)
+
+def _check_object_shadows(
+    object_x: float, object_y: float, object_z: float, sun_x: float, sun_y: float, sun_z: float, check_umbra: bool = True
+) -> tuple[bool, bool]:
+    """Scalar kernel for check_object_shadows, working on plain floats so no NumPy dispatch is involved.
+
+    Args:
+        object_x, object_y, object_z (float): the Earth-Object vector components in an ECI frame.
+        sun_x, sun_y, sun_z (float): the Earth-Sun vector components in the same frame.
+        check_umbra (bool): whether to evaluate the umbra at all; if False, in_umbra is always False.
+
+    Returns:
+        in_umbra (bool): whether the object is in the umbra.
+        in_penumbra (bool): whether the object is in the penumbra.
+
+    """
+    # The shadow cone half angles are atan(k/d); their sines and tangents are taken algebraically.
+    earth_sun_distance = math.sqrt(sun_x*sun_x + sun_y*sun_y + sun_z*sun_z)
+
+    in_umbra = False
+    in_penumbra = False
+    
+    object_dot_sun = object_x*sun_x + object_y*sun_y + object_z*sun_z
+    if object_dot_sun < 0.0:
+        # Components of the object position along and perpendicular to the anti-Sun direction
+        sathoriz = -object_dot_sun/earth_sun_distance
+        # satvert is only compared against the cone radii, so it is kept squared (|r|^2 - sathoriz^2)
+        satvert_squared = object_x*object_x + object_y*object_y + object_z*object_z - sathoriz*sathoriz
+        x = earth_radius_km*math.hypot(_PENUMBRA_K, earth_sun_distance)/_PENUMBRA_K
+        penvert = _PENUMBRA_K/earth_sun_distance*(x + sathoriz)
+        if satvert_squared <= penvert*penvert:
+            in_penumbra = True
+            if not check_umbra:
+                return in_umbra, in_penumbra
+            y = earth_radius_km*math.hypot(_UMBRA_K, earth_sun_distance)/_UMBRA_K
+            umbvert = _UMBRA_K/earth_sun_distance*(y - sathoriz)
+            # Beyond the tip of the umbra cone its radius goes negative
+            if umbvert >= 0.0 and satvert_squared <= umbvert*umbvert:
+                in_umbra = True
+
+    return in_umbra, in_penumbra
+
 def check_object_shadows(earth_object_position_vector_eci: np.ndarray, earth_sun_position_vector_eci: np.ndarray) -> tuple[bool, bool]:
     """Checks if an object is in umbra and/or penumbra.
 
@@ -21,32 +68,11 @@ def check_object_shadows(earth_object_position_vector_eci: np.ndarray, earth_sun
 
     """
     # Argument checking
-    if not isinstance(earth_object_position_vector_eci, np.ndarray):
-        raise TypeError(f"arg 'earth_object_position_vector_eci' must be of type np.ndarray, not {type(earth_object_position_vector_eci)}")
-    if not isinstance(earth_sun_position_vector_eci, np.ndarray):
-        raise TypeError(f"arg 'earth_sun_position_vector_eci' must be of type np.ndarray, not {type(earth_sun_position_vector_eci)}")
-    
-    earth_sun_distance = norm(earth_sun_position_vector_eci)
-    umbra_angle = np.arctan((sun_radius_km-earth_radius_km)/earth_sun_distance)
-    penumbra_angle = np.arctan((sun_radius_km+earth_radius_km)/earth_sun_distance)
-
-    in_umbra = False
-    in_penumbra = False
+    if __debug__:
+        require_type("earth_object_position_vector_eci", earth_object_position_vector_eci, np.ndarray)
+        require_type("earth_sun_position_vector_eci", earth_sun_position_vector_eci, np.ndarray)
     
-    if np.dot(earth_object_position_vector_eci, earth_sun_position_vector_eci) < 0.0:
-        angle = angle_between_vectors(-earth_sun_position_vector_eci, earth_object_position_vector_eci)
-        sathoriz = norm(earth_object_position_vector_eci)*np.cos(angle)
-        satvert  = norm(earth_object_position_vector_eci)*np.sin(angle)
-        x = earth_radius_km/np.sin(penumbra_angle)
-        penvert = np.tan(penumbra_angle)*(x + sathoriz)
-        if satvert <= penvert:
-            in_penumbra = True
-            y = earth_radius_km/np.sin(umbra_angle)
-            umbvert = np.tan(umbra_angle)*(y-sathoriz)
-            if satvert <= umbvert:
-                in_umbra = True
-
-    return in_penumbra, in_umbra
+    return _check_object_shadows(*earth_object_position_vector_eci.tolist(), *earth_sun_position_vector_eci.tolist())
 
 def is_in_eclipse(earth_object_position_vector_eci: np.ndarray, earth_sun_position_vector_eci: np.ndarray) -> bool:
     """Checks if an object is in eclipse - that is, in either umbra or penumbra.
@@ -63,12 +89,89 @@ def is_in_eclipse(earth_object_position_vector_eci: np.ndarray, earth_sun_positi
 
     """
     # Argument checking
-    if not isinstance(earth_object_position_vector_eci, np.ndarray):
-        raise TypeError(f"arg 'earth_object_position_vector_eci' must be of type np.ndarray, not {type(earth_object_position_vector_eci)}")
-    if not isinstance(earth_sun_position_vector_eci, np.ndarray):
-        raise TypeError(f"arg 'earth_sun_position_vector_eci' must be of type np.ndarray, not {type(earth_sun_position_vector_eci)}")
+    if __debug__:
+        require_type("earth_object_position_vector_eci", earth_object_position_vector_eci, np.ndarray)
+        require_type("earth_sun_position_vector_eci", earth_sun_position_vector_eci, np.ndarray)
     
-    in_penumbra, in_umbra = check_object_shadows(earth_object_position_vector_eci, earth_sun_position_vector_eci)
-    if in_penumbra or in_umbra:
-        return True
-    return False
\ No newline at end of file
+    # The umbra lies inside the penumbra cone, so the umbra test can be skipped
+    _, in_penumbra = _check_object_shadows(*earth_object_position_vector_eci.tolist(), *earth_sun_position_vector_eci.tolist(), check_umbra=False)
+    return in_penumbra
+
+def is_in_penumbra_only(earth_object_position_vector_eci: np.ndarray, earth_sun_position_vector_eci: np.ndarray) -> bool:
+    """Checks if an object is in partial eclipse - that is, in the penumbra but not the umbra.
+
+    Args:
+        earth_object_position_vector_eci (np.ndarray): the Earth-Object vector in an ECI frame.
+        earth_sun_position_vector_eci (np.ndarray): the Earth-Sun vector in an ECI frame.
+
+    Returns:
+        in_penumbra_only (bool): whether the object is in the penumbra but not the umbra.
+    
+    Raises:
+        TypeError: if arguments are not of expected types.
+
+    """
+    # Argument checking
+    if __debug__:
+        require_type("earth_object_position_vector_eci", earth_object_position_vector_eci, np.ndarray)
+        require_type("earth_sun_position_vector_eci", earth_sun_position_vector_eci, np.ndarray)
+    
+    # Outside the penumbra the kernel returns before any umbra arithmetic
+    in_umbra, in_penumbra = _check_object_shadows(*earth_object_position_vector_eci.tolist(), *earth_sun_position_vector_eci.tolist())
+    return in_penumbra and not in_umbra
+
+def check_object_shadows_batch(earth_object_position_vectors_eci: np.ndarray, earth_sun_position_vectors_eci: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Checks if each of a batch of object positions is in umbra and/or penumbra.
+
+    Args:
+        earth_object_position_vectors_eci (np.ndarray): (N, 3) array of Earth-Object vectors in an ECI frame.
+        earth_sun_position_vectors_eci (np.ndarray): (N, 3) array of Earth-Sun vectors in the same frame, or a single
+            (3,) Earth-Sun vector shared by every object.
+
+    Returns:
+        in_umbra (np.ndarray): boolean array of length N, whether each object is in the umbra.
+        in_penumbra (np.ndarray): boolean array of length N, whether each object is in the penumbra.
+    
+    Raises:
+        TypeError: if arguments are not of expected types.
+
+    """
+    # Argument checking
+    if __debug__:
+        require_type("earth_object_position_vectors_eci", earth_object_position_vectors_eci, np.ndarray)
+        require_type("earth_sun_position_vectors_eci", earth_sun_position_vectors_eci, np.ndarray)
+
+    earth_sun_position_vectors_eci = np.broadcast_to(earth_sun_position_vectors_eci, earth_object_position_vectors_eci.shape)
+    earth_sun_distances = np.sqrt(np.einsum("ij,ij->i", earth_sun_position_vectors_eci, earth_sun_position_vectors_eci))
+    object_distances_squared = np.einsum("ij,ij->i", earth_object_position_vectors_eci, earth_object_position_vectors_eci)
+    object_dot_sun = np.einsum("ij,ij->i", earth_object_position_vectors_eci, earth_sun_position_vectors_eci)
+
+    sathoriz = -object_dot_sun/earth_sun_distances
+    satvert_squared = object_distances_squared - sathoriz*sathoriz
+    x = earth_radius_km*np.hypot(_PENUMBRA_K, earth_sun_distances)/_PENUMBRA_K
+    penvert = _PENUMBRA_K/earth_sun_distances*(x + sathoriz)
+    y = earth_radius_km*np.hypot(_UMBRA_K, earth_sun_distances)/_UMBRA_K
+    umbvert = _UMBRA_K/earth_sun_distances*(y - sathoriz)
+
+    in_penumbra = (object_dot_sun < 0.0) & (satvert_squared <= penvert*penvert)
+    in_umbra = in_penumbra & (umbvert >= 0.0) & (satvert_squared <= umbvert*umbvert)
+    return in_umbra, in_penumbra
+
+def is_in_eclipse_batch(earth_object_position_vectors_eci: np.ndarray, earth_sun_position_vectors_eci: np.ndarray) -> np.ndarray:
+    """Checks if each of a batch of object positions is in eclipse - that is, in either umbra or penumbra.
+
+    Args:
+        earth_object_position_vectors_eci (np.ndarray): (N, 3) array of Earth-Object vectors in an ECI frame.
+        earth_sun_position_vectors_eci (np.ndarray): (N, 3) array of Earth-Sun vectors in the same frame, or a single
+            (3,) Earth-Sun vector shared by every object.
+
+    Returns:
+        in_eclipse (np.ndarray): boolean array of length N, whether each object is in eclipse.
+    
+    Raises:
+        TypeError: if arguments are not of expected types.
+
+    """
+    # The umbra lies inside the penumbra cone, so the penumbra mask is the eclipse mask.
+    _, in_penumbra = check_object_shadows_batch(earth_object_position_vectors_eci, earth_sun_position_vectors_eci)
+    return in_penumbra
@@ -1,12 +1,32 @@
+import math
+
 import numpy as np
 
 def norm(x: np.ndarray) -> float:
+    if x.shape == (3,):
+        return math.hypot(*x.tolist())
     return np.linalg.norm(x, axis=0)
 
 def unit_vector(x: np.ndarray) -> np.ndarray:
     return x / norm(x)
 
+def _angle_between_3_vectors(a: np.ndarray, b: np.ndarray) -> float:
+    ax, ay, az = a.tolist()
+    bx, by, bz = b.tolist()
+    n_a = math.sqrt(ax * ax + ay * ay + az * az)
+    n_b = math.sqrt(bx * bx + by * by + bz * bz)
+    dx, dy, dz = n_b * ax - n_a * bx, n_b * ay - n_a * by, n_b * az - n_a * bz
+    sx, sy, sz = n_b * ax + n_a * bx, n_b * ay + n_a * by, n_b * az + n_a * bz
+    return 2 * math.atan2(math.sqrt(dx * dx + dy * dy + dz * dz), math.sqrt(sx * sx + sy * sy + sz * sz))
+
 def angle_between_vectors(a: np.ndarray, b: np.ndarray, units: str = "radians") -> float:
+    if a.shape == (3,) and b.shape == (3,):
+        angle_rad = _angle_between_3_vectors(a, b)
+        if units == "degrees":
+            return math.degrees(angle_rad)
+        elif units == "radians":
+            return angle_rad
+        raise ValueError(f"unknown units {units!r}")
     n_a = np.linalg.norm(a, axis=0)
     n_b = np.linalg.norm(b, axis=0)
     y = np.linalg.norm(n_b * a - n_a * b, axis=0)
@@ -16,3 +36,16 @@ def angle_between_vectors(a: np.ndarray, b: np.ndarray, units: str = "radians")
         return np.rad2deg(angle_rad)
     elif units == "radians":
         return angle_rad
+    raise ValueError(f"unknown units {units!r}")
+
+def angle_between_vectors_batch(a: np.ndarray, b: np.ndarray, units: str = "radians") -> np.ndarray:
+    n_a = np.linalg.norm(a, axis=-1, keepdims=True)
+    n_b = np.linalg.norm(b, axis=-1, keepdims=True)
+    y = np.linalg.norm(n_b * a - n_a * b, axis=-1)
+    x = np.linalg.norm(n_b * a + n_a * b, axis=-1)
+    angle_rad = 2 * np.arctan2(y, x)
+    if units == "degrees":
+        return np.rad2deg(angle_rad)
+    elif units == "radians":
+        return angle_rad
+    raise ValueError(f"unknown units {units!r}")
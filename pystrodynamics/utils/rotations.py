@@ -1,13 +1,70 @@
 """Functions that provide rotations between reference frames."""
 
 # Standard library imports
+import math
+from typing import Union
 
 # Third-party imports
 import numpy as np
 from scipy.spatial.transform import Rotation as R
 
 # Local imports
-from pystrodynamics.utils.math import unit_vector
+from pystrodynamics.utils.argument_checking import require_type
+
+def rotation_to_matrix(rotation: Union[R, np.ndarray]) -> np.ndarray:
+    """Get a rotation as a (3, 3) matrix, whether given as a scipy Rotation or already as a matrix.
+
+    Args:
+        rotation (Union[R, np.ndarray]): A scipy.spatial.transform.Rotation object or a (3, 3) rotation matrix.
+
+    Returns:
+        rotation_matrix (np.ndarray): The (3, 3) rotation matrix.
+
+    Raises:
+        TypeError: if the rotation is not of expected type.
+        ValueError: if the rotation matrix is not of shape (3, 3).
+
+    """
+    # Not gated on __debug__: the type check is part of dispatching on the rotation's form
+    if isinstance(rotation, R):
+        return rotation.as_matrix()
+    require_type("rotation", rotation, (R, np.ndarray))
+    if rotation.shape != (3, 3):
+        raise ValueError(f"'rotation' matrix must be of shape (3, 3), not {rotation.shape}")
+    return rotation
+
+def gcrs_to_lvlh_matrix(position_vector_gcrs: np.ndarray, velocity_vector_gcrs: np.ndarray) -> np.ndarray:
+    """Compute the rotation matrix from the GCRS frame
+    to the Local Vertical Local Horizontal (LVLH) frame.
+
+    The rows of the matrix are the LVLH basis vectors expressed in GCRS, so
+    `gcrs_to_lvlh_matrix @ vector_gcrs` gives the vector in LVLH. The z-axis points
+    towards the center of the Earth, the y-axis opposite the orbit normal, and the
+    x-axis completes the right-handed system (along the velocity for circular orbits).
+
+    Args:
+        position_vector_gcrs (np.ndarray): A 3-element numpy array representing the position 
+                              vector of the satellite in GCRS frame.
+        velocity_vector_gcrs (np.ndarray): A 3-element numpy array representing the velocity 
+                              vector of the satellite in GCRS frame.
+
+    Returns:
+        gcrs_to_lvlh_matrix (np.ndarray): A (3, 3) rotation matrix from GCRS frame to LVLH frame.
+
+    """
+    # Written out on scalars: one allocation for the result instead of a temporary per cross product and norm
+    px, py, pz = position_vector_gcrs.tolist()
+    vx, vy, vz = velocity_vector_gcrs.tolist()
+    hx, hy, hz = py * vz - pz * vy, pz * vx - px * vz, px * vy - py * vx
+    inverse_r = 1.0 / math.hypot(px, py, pz)
+    inverse_h = 1.0 / math.hypot(hx, hy, hz)
+    # x = y cross z = (h cross r) / (|h| |r|)
+    inverse_rh = inverse_r * inverse_h
+    return np.array([
+        [(hy * pz - hz * py) * inverse_rh, (hz * px - hx * pz) * inverse_rh, (hx * py - hy * px) * inverse_rh],
+        [-hx * inverse_h, -hy * inverse_h, -hz * inverse_h],
+        [-px * inverse_r, -py * inverse_r, -pz * inverse_r],
+    ], dtype=np.result_type(position_vector_gcrs, velocity_vector_gcrs, 1.0))
 
 def gcrs_to_lvlh_rotation(position_vector_gcrs: np.ndarray, velocity_vector_gcrs: np.ndarray) -> R:
     """Compute the rotation from the GCRS frame 
@@ -33,19 +90,12 @@ def gcrs_to_lvlh_rotation(position_vector_gcrs: np.ndarray, velocity_vector_gcrs
 
     """
     # Argument checking
-    if not isinstance(position_vector_gcrs, np.ndarray):
-        raise TypeError(f"arg 'position_vector_gcrs' must be of type np.ndarray, not {type(position_vector_gcrs)}")
-    if not isinstance(velocity_vector_gcrs, np.ndarray):
-        raise TypeError(f"arg 'velocity_vector_gcrs' must be of type np.ndarray, not {type(velocity_vector_gcrs)}")
+    if __debug__:
+        require_type("position_vector_gcrs", position_vector_gcrs, np.ndarray)
+        require_type("velocity_vector_gcrs", velocity_vector_gcrs, np.ndarray)
     if len(position_vector_gcrs) != 3:
         raise IndexError(f"'position_vector_gcrs' must be of length 3, not {len(position_vector_gcrs)}")
     if len(velocity_vector_gcrs) != 3:
         raise IndexError(f"'velocity_vector_gcrs' must be of length 3, not {len(velocity_vector_gcrs)}")
 
-    r_v_cross = np.cross(position_vector_gcrs, velocity_vector_gcrs)
-    x = unit_vector(position_vector_gcrs)
-    z = r_v_cross / unit_vector(r_v_cross)
-    y = np.cross(x, z)
-    rotation_matrix = np.stack(x, y, z)
-    gcrs_to_lvlh_rotation = R.from_matrix(rotation_matrix)
-    return gcrs_to_lvlh_rotation
\ No newline at end of file
+    return R.from_matrix(gcrs_to_lvlh_matrix(position_vector_gcrs, velocity_vector_gcrs))
\ No newline at end of file
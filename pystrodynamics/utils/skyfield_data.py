@@ -0,0 +1,46 @@
+"""Shared skyfield data (timescale and planetary ephemeris), loaded once per process."""
+
+# Standard library imports
+from threading import Lock
+
+# Third part imports
+from skyfield.api import load
+from skyfield.jpllib import SpiceKernel
+from skyfield.timelib import Timescale
+
+EPHEMERIS_FILENAME = "de430_1850-2150.bsp"
+
+# Loading the timescale parses the bundled leap second and Delta T tables, and opening
+# the ephemeris maps a large kernel file; both cost far more than the lookups that use
+# them, so they are loaded on first use and kept open for the life of the process.
+_timescale = None
+_ephemeris = None
+_lock = Lock()
+
+def get_timescale() -> Timescale:
+    """Returns the shared skyfield timescale, loading it on first use.
+
+    Returns:
+        timescale (Timescale): the process-wide skyfield timescale.
+
+    """
+    global _timescale
+    if _timescale is None:
+        with _lock:
+            if _timescale is None:
+                _timescale = load.timescale()
+    return _timescale
+
+def get_ephemeris() -> SpiceKernel:
+    """Returns the shared DE430 ephemeris, opening it on first use.
+
+    Returns:
+        ephemeris (SpiceKernel): the process-wide DE430 kernel, left open.
+
+    """
+    global _ephemeris
+    if _ephemeris is None:
+        with _lock:
+            if _ephemeris is None:
+                _ephemeris = load(EPHEMERIS_FILENAME)
+    return _ephemeris
@@ -1,14 +1,19 @@
 """Utilities for getting Earth-Sun vectors in a reference frame at a UTC epoch."""
 
 # Standard library imports
-from contextlib import closing
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Sequence, Union
 
 # Third part imports
 import numpy as np
-from skyfield.api import load
+from scipy.interpolate import CubicSpline
 from skyfield.sgp4lib import TEME
+from skyfield.timelib import Time
 
+# Local imports
+from pystrodynamics.utils.argument_checking import require_element_types, require_type
+from pystrodynamics.utils.skyfield_data import get_ephemeris, get_timescale
 
 def get_earth_sun_vector_gcrs_at_epoch(epoch: datetime) -> np.ndarray:
     """Get the Earth-Sun position vector in GCRS at given epoch.
@@ -21,18 +26,10 @@ def get_earth_sun_vector_gcrs_at_epoch(epoch: datetime) -> np.ndarray:
 
     """
     # Argument checking
-    if not isinstance(epoch, datetime):
-        raise TypeError(f"arg 'epoch' must be of type datetime, not {type(epoch)}")
+    if __debug__:
+        require_type("epoch", epoch, datetime)
 
-    ts = load.timescale()
-    epoch = epoch.replace(tzinfo=timezone.utc)
-    t = ts.from_datetime(epoch)
-    bodies = load("de430_1850-2150.bsp")
-    with closing(bodies):
-        sun = bodies["sun"]
-        earth = bodies["earth"]
-        earth_sun_vector_gcrs_at_epoch = earth.at(t).observe(sun).position.km
-        return np.array(earth_sun_vector_gcrs_at_epoch)
+    return get_cached_earth_sun_vector_gcrs_at_epoch(epoch).copy()
 
 
 def get_earth_sun_vector_teme_at_epoch(epoch: datetime) -> np.ndarray:
@@ -46,16 +43,232 @@ def get_earth_sun_vector_teme_at_epoch(epoch: datetime) -> np.ndarray:
 
     """
     # Argument checking
-    if not isinstance(epoch, datetime):
-        raise TypeError(f"arg 'epoch' must be of type datetime, not {type(epoch)}")
-
-    ts = load.timescale()
-    epoch = epoch.replace(tzinfo=timezone.utc)
-    t = ts.from_datetime(epoch)
-    bodies = load("de430_1850-2150.bsp")
-    with closing(bodies):
-        sun = bodies["sun"]
-        earth = bodies["earth"]
-        gcrs_vector = earth.at(t).observe(sun)
-        teme_vector = gcrs_vector.frame_xyz(TEME).km
-        return np.array(teme_vector)
\ No newline at end of file
+    if __debug__:
+        require_type("epoch", epoch, datetime)
+
+    return get_cached_earth_sun_vector_teme_at_epoch(epoch).copy()
+
+
+def get_cached_earth_sun_vector_gcrs_at_epoch(epoch: datetime) -> np.ndarray:
+    """Get the Earth-Sun position vector in GCRS at given epoch, memoized on the epoch.
+
+    Objects sharing an epoch (e.g. every spacecraft in a simulation tick) share one
+    ephemeris lookup, as do the GCRS and TEME getters. The returned array is read-only
+    since it is shared between callers.
+
+    Args:
+        epoch (datetime): The epoch to use for getting the sun vector, read as UTC.
+
+    Returns:
+        earth_sun_vector_gcrs_at_epoch (np.ndarray): the position of the sun in GCRS frame at epoch.
+
+    """
+    # The wall-clock time is read as UTC, and aware datetimes compare (and hash) as instants,
+    # so the tzinfo is replaced before the lookup rather than inside the memoized function
+    return _cached_earth_sun_vector_gcrs_at_epoch(epoch.replace(tzinfo=timezone.utc))
+
+
+def get_cached_earth_sun_vector_teme_at_epoch(epoch: datetime) -> np.ndarray:
+    """Get the Earth-Sun position vector in TEME at given epoch, memoized on the epoch.
+
+    Objects sharing an epoch (e.g. every spacecraft in a simulation tick) share one
+    ephemeris lookup. The returned array is read-only since it is shared between callers.
+
+    Args:
+        epoch (datetime): The epoch to use for getting the sun vector, read as UTC.
+
+    Returns:
+        earth_sun_vector_teme_at_epoch (np.ndarray): the position of the sun in TEME frame at epoch.
+
+    """
+    return _cached_earth_sun_vector_teme_at_epoch(epoch.replace(tzinfo=timezone.utc))
+
+
+@lru_cache(maxsize=256)
+def _cached_earth_sun_vector_gcrs_at_epoch(epoch: datetime) -> np.ndarray:
+    """Looks up the read-only GCRS Earth-Sun vector at a UTC epoch, memoized on the epoch."""
+    earth_sun_vector_gcrs_at_epoch = _earth_sun_vectors_at(get_timescale().from_datetime(epoch), "GCRS")
+    earth_sun_vector_gcrs_at_epoch.flags.writeable = False
+    return earth_sun_vector_gcrs_at_epoch
+
+
+@lru_cache(maxsize=256)
+def _cached_earth_sun_vector_teme_at_epoch(epoch: datetime) -> np.ndarray:
+    """Rotates the memoized GCRS Earth-Sun vector at a UTC epoch into TEME, memoized on the epoch."""
+    # TEME is a rotation of the memoized GCRS vector, so the ephemeris lookup is shared between frames
+    earth_sun_vector_teme_at_epoch = TEME.rotation_at(get_timescale().from_datetime(epoch)) @ _cached_earth_sun_vector_gcrs_at_epoch(epoch)
+    earth_sun_vector_teme_at_epoch.flags.writeable = False
+    return earth_sun_vector_teme_at_epoch
+
+
+def _earth_sun_vectors_at(t: Time, reference_frame: str) -> np.ndarray:
+    """Get the Earth-Sun position vectors at one or many skyfield times.
+
+    Args:
+        t (Time): the skyfield time(s) at which to get the sun vector.
+        reference_frame (str): the frame of the returned vectors, one of ['GCRS', 'TEME'].
+
+    Returns:
+        earth_sun_vectors (np.ndarray): the position of the sun, shaped (3,) or (3, N) like skyfield positions.
+
+    """
+    bodies = get_ephemeris()
+    gcrs_vector = bodies["earth"].at(t).observe(bodies["sun"])
+    if reference_frame == "TEME":
+        return np.array(gcrs_vector.frame_xyz(TEME).km)
+    return np.array(gcrs_vector.position.km)
+
+
+def get_times_at_epochs(epochs: Sequence[datetime]) -> Time:
+    """Get the skyfield times for many UTC epochs.
+
+    The returned times carry the epochs' UT1/TT/TDB reduction and cache their precession
+    and nutation on first use, so passing the same times to both the GCRS and the TEME
+    batched lookups does that work once.
+
+    Args:
+        epochs (Sequence[datetime]): the epochs to convert.
+
+    Returns:
+        times (Time): the skyfield times of the epochs.
+
+    Raises:
+        TypeError: if an epoch is not a datetime.
+
+    """
+    # Argument checking
+    if __debug__:
+        require_element_types("epochs", epochs, datetime)
+
+    return get_timescale().from_datetimes([epoch.replace(tzinfo=timezone.utc) for epoch in epochs])
+
+
+def _earth_sun_vectors_at_epochs(epochs: Union[Sequence[datetime], Time], reference_frame: str) -> np.ndarray:
+    """Get the Earth-Sun position vectors at many UTC epochs with one batched ephemeris lookup.
+
+    Args:
+        epochs (Sequence[datetime] | Time): the epochs at which to get the sun vectors, or their skyfield times.
+        reference_frame (str): the frame of the returned vectors, one of ['GCRS', 'TEME'].
+
+    Returns:
+        earth_sun_vectors (np.ndarray): (N, 3) positions of the sun in the given frame, one row per epoch.
+
+    """
+    t = epochs if isinstance(epochs, Time) else get_times_at_epochs(epochs)
+    return np.ascontiguousarray(_earth_sun_vectors_at(t, reference_frame).T)
+
+
+def get_earth_sun_vectors_gcrs_at_epochs(epochs: Union[Sequence[datetime], Time]) -> np.ndarray:
+    """Get the Earth-Sun position vectors in GCRS at many epochs.
+
+    Equivalent to calling get_earth_sun_vector_gcrs_at_epoch on each epoch, but the
+    ephemeris lookup and light-time iteration run once over all epochs.
+
+    Args:
+        epochs (Sequence[datetime] | Time): the epochs to use for getting the sun vectors, or
+            their times from get_times_at_epochs.
+
+    Returns:
+        earth_sun_vectors_gcrs (np.ndarray): (N, 3) positions of the sun in GCRS frame, one row per epoch.
+
+    """
+    return _earth_sun_vectors_at_epochs(epochs, "GCRS")
+
+
+def get_earth_sun_vectors_teme_at_epochs(epochs: Union[Sequence[datetime], Time]) -> np.ndarray:
+    """Get the Earth-Sun position vectors in TEME at many epochs.
+
+    Equivalent to calling get_earth_sun_vector_teme_at_epoch on each epoch, but the
+    ephemeris lookup and frame rotation run once over all epochs.
+
+    Args:
+        epochs (Sequence[datetime] | Time): the epochs to use for getting the sun vectors, or
+            their times from get_times_at_epochs.
+
+    Returns:
+        earth_sun_vectors_teme (np.ndarray): (N, 3) positions of the sun in TEME frame, one row per epoch.
+
+    """
+    return _earth_sun_vectors_at_epochs(epochs, "TEME")
+
+
+class SunVectorInterpolator:
+    """Earth-Sun vectors sampled on a time grid and served from a cubic spline.
+
+    The Earth-Sun vector is smooth over minutes, so one batched ephemeris lookup on
+    a coarse grid followed by spline evaluation replaces a full skyfield lookup
+    (with light-time iteration) per epoch. At the default 10 minute spacing the
+    interpolation error is far below 100 m on the 1 AU baseline.
+
+    Attributes:
+        start_epoch (datetime): the first epoch of the grid.
+        end_epoch (datetime): the last epoch covered by the grid.
+        step (timedelta): the spacing of the grid.
+        reference_frame (str): the frame of the interpolated vectors, one of ['GCRS', 'TEME'].
+
+    """
+
+    def __init__(self, start_epoch: datetime, end_epoch: datetime, step: timedelta = timedelta(minutes=10), reference_frame: str = "GCRS") -> None:
+        """Initializes the interpolator, looking up the Sun at every grid point in one batched call.
+
+        Args:
+            start_epoch (datetime): the first epoch the grid must cover.
+            end_epoch (datetime): the last epoch the grid must cover.
+            step (timedelta): the spacing of the grid. Defaults to 10 minutes.
+            reference_frame (str): the frame of the interpolated vectors, one of ['GCRS', 'TEME']. Defaults to 'GCRS'.
+
+        Raises:
+            TypeError: if arguments are not of expected type.
+            ValueError: if the epochs are out of order, the step is not positive or the frame is unknown.
+
+        """
+        # Argument checking
+        if __debug__:
+            require_type("start_epoch", start_epoch, datetime)
+            require_type("end_epoch", end_epoch, datetime)
+            require_type("step", step, timedelta)
+            require_type("reference_frame", reference_frame, str)
+        if step <= timedelta(0):
+            raise ValueError(f"'step' must be positive (gave {step})")
+        if reference_frame not in ["GCRS", "TEME"]:
+            raise ValueError(f"'reference_frame' must be one of ['GCRS', 'TEME'] (gave {reference_frame}")
+
+        self.start_epoch = start_epoch.replace(tzinfo=timezone.utc)
+        self.end_epoch = end_epoch.replace(tzinfo=timezone.utc)
+        self.step = step
+        self.reference_frame = reference_frame
+        if self.end_epoch < self.start_epoch:
+            raise ValueError(f"'end_epoch' must not be before 'start_epoch' (gave {start_epoch} to {end_epoch})")
+
+        # Always at least two points so there is an interval to interpolate over
+        number_of_steps = max(1, int(np.ceil((self.end_epoch - self.start_epoch) / step)))
+        grid_epochs = [self.start_epoch + i * step for i in range(number_of_steps + 1)]
+        self._step_seconds = step.total_seconds()
+        grid_seconds = np.arange(number_of_steps + 1) * self._step_seconds
+        earth_sun_vectors = _earth_sun_vectors_at(get_timescale().from_datetimes(grid_epochs), reference_frame)
+        # Keep the piecewise cubic coefficients as (N - 1, 4, 3) so one interval is a single contiguous slice
+        spline = CubicSpline(grid_seconds, earth_sun_vectors.T, axis=0)
+        self._coefficients = np.ascontiguousarray(np.transpose(spline.c, (1, 0, 2)))
+
+    def earth_sun_vector(self, epoch: datetime) -> np.ndarray:
+        """Returns the interpolated Earth-Sun vector at an epoch.
+
+        Args:
+            epoch (datetime): the epoch at which to get the sun vector, within the grid.
+
+        Returns:
+            earth_sun_vector (np.ndarray): the position of the sun in the interpolator's frame at epoch.
+
+        Raises:
+            ValueError: if the epoch is outside the grid.
+
+        """
+        epoch = epoch.replace(tzinfo=timezone.utc)
+        if not self.start_epoch <= epoch <= self.end_epoch:
+            raise ValueError(f"'epoch' must be within the grid [{self.start_epoch}, {self.end_epoch}] (gave {epoch})")
+
+        seconds = (epoch - self.start_epoch).total_seconds()
+        index = min(int(seconds / self._step_seconds), len(self._coefficients) - 1)
+        dt = seconds - index * self._step_seconds
+        c3, c2, c1, c0 = self._coefficients[index]
+        return ((c3 * dt + c2) * dt + c1) * dt + c0
@@ -1,5 +1,78 @@
 # Standard library imports
+from datetime import datetime
 
 # Third party imports
+import numpy as np
 
-# Local imports
\ No newline at end of file
+# Local imports
+from pystrodynamics.simulation_objects.orbital_object import OrbitalObject
+from pystrodynamics.utils.propagation import tle_and_epoch_to_state_vectors
+
+ISS_TLE_LINE1 = "1 25544U 98067A   23339.50000000  .00016717  00000-0  10270-3 0  9005"
+ISS_TLE_LINE2 = "2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391563537"
+
+def test_update_state_matches_tle_propagation():
+    epoch = datetime(2023, 12, 5, 15, 0, 0, 500000)
+    orbital_object = OrbitalObject("ISS", epoch, ISS_TLE_LINE1, ISS_TLE_LINE2)
+
+    position_vector_teme, velocity_vector_teme = tle_and_epoch_to_state_vectors(ISS_TLE_LINE1, ISS_TLE_LINE2, epoch, "TEME")
+    position_vector_gcrs, velocity_vector_gcrs = tle_and_epoch_to_state_vectors(ISS_TLE_LINE1, ISS_TLE_LINE2, epoch, "GCRS")
+
+    assert np.allclose(orbital_object.position_vector_teme, position_vector_teme)
+    assert np.allclose(orbital_object.velocity_vector_teme, velocity_vector_teme)
+    assert np.allclose(orbital_object.position_vector_gcrs, position_vector_gcrs)
+    assert np.allclose(orbital_object.velocity_vector_gcrs, velocity_vector_gcrs)
+
+def test_batch_update_state_matches_update_state():
+    initial_epoch = datetime(2023, 12, 5, 15)
+    new_epoch = datetime(2023, 12, 5, 16, 30)
+    batched = [OrbitalObject(f"ISS-{i}", initial_epoch, ISS_TLE_LINE1, ISS_TLE_LINE2) for i in range(3)]
+    single = OrbitalObject("ISS", initial_epoch, ISS_TLE_LINE1, ISS_TLE_LINE2)
+
+    OrbitalObject.batch_update_state(batched, new_epoch)
+    single.update_state(new_epoch)
+
+    for orbital_object in batched:
+        assert orbital_object.epoch == single.epoch
+        assert np.allclose(orbital_object.position_vector_teme, single.position_vector_teme)
+        assert np.allclose(orbital_object.velocity_vector_teme, single.velocity_vector_teme)
+        assert np.allclose(orbital_object.position_vector_gcrs, single.position_vector_gcrs)
+        assert np.allclose(orbital_object.velocity_vector_gcrs, single.velocity_vector_gcrs)
+
+def test_classical_orbital_elements_cached_per_epoch():
+    orbital_object = OrbitalObject("ISS", datetime(2023, 12, 5, 15), ISS_TLE_LINE1, ISS_TLE_LINE2)
+
+    classical_orbital_elements_teme = orbital_object.classical_orbital_elements()
+    assert classical_orbital_elements_teme is orbital_object.classical_orbital_elements("TEME")
+    assert np.isclose(classical_orbital_elements_teme.inclination, np.deg2rad(51.64), atol=1e-2)
+
+    orbital_object.update_state(datetime(2023, 12, 5, 16))
+    assert classical_orbital_elements_teme is not orbital_object.classical_orbital_elements("TEME")
+
+def test_propagate_range_matches_update_state():
+    epochs = [datetime(2023, 12, 5, 15, minute) for minute in range(0, 60, 10)]
+    orbital_object = OrbitalObject("ISS", epochs[0], ISS_TLE_LINE1, ISS_TLE_LINE2)
+
+    position_vectors_teme, velocity_vectors_teme = orbital_object.propagate_range(epochs)
+
+    assert position_vectors_teme.shape == (len(epochs), 3)
+    assert velocity_vectors_teme.shape == (len(epochs), 3)
+    assert orbital_object.epoch.replace(tzinfo=None) == epochs[0]
+    for epoch, position_vector_teme, velocity_vector_teme in zip(epochs, position_vectors_teme, velocity_vectors_teme):
+        orbital_object.update_state(epoch)
+        assert np.allclose(position_vector_teme, orbital_object.position_vector_teme)
+        assert np.allclose(velocity_vector_teme, orbital_object.velocity_vector_teme)
+
+def test_batch_update_state_single_precision():
+    initial_epoch = datetime(2023, 12, 5, 15)
+    new_epoch = datetime(2023, 12, 5, 16, 30)
+    single_precision = OrbitalObject("ISS-32", initial_epoch, ISS_TLE_LINE1, ISS_TLE_LINE2)
+    double_precision = OrbitalObject("ISS-64", initial_epoch, ISS_TLE_LINE1, ISS_TLE_LINE2)
+
+    OrbitalObject.batch_update_state([single_precision], new_epoch, dtype=np.float32)
+    OrbitalObject.batch_update_state([double_precision], new_epoch)
+
+    assert single_precision.position_vector_teme.dtype == np.float32
+    assert single_precision.position_vector_gcrs.dtype == np.float32
+    assert single_precision.gcrs_to_lvlh_matrix.dtype == np.float32
+    assert np.allclose(single_precision.position_vector_gcrs, double_precision.position_vector_gcrs, rtol=0, atol=1e-2)
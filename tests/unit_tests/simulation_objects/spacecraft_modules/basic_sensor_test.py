@@ -1,5 +1,61 @@
 # Standard library imports
 
 # Third party imports
+import numpy as np
+from scipy.spatial.transform import Rotation as R
 
-# Local imports
\ No newline at end of file
+# Local imports
+from pystrodynamics.simulation_objects.spacecraft_modules.basic_sensor import BasicSensor
+
+def test_target_is_accessible_matches_angle_checks():
+    sensor = BasicSensor("sensor", np.array([1.0, 0.0, 0.0]), 30.0, 30.0, 1000.0, 10.0)
+    body_to_frame_rotation = R.from_euler("z", 90, degrees=True)
+    spacecraft_to_target_vectors = np.array([[0.0, 500.0, 0.0], [0.0, 1500.0, 0.0], [500.0, 0.0, 0.0], [50.0, 500.0, 0.0], [0.0, -500.0, 0.0]])
+
+    expected = [
+        sensor.target_in_field_of_view(body_to_frame_rotation, target_vector) and sensor.target_in_range(target_vector)
+        for target_vector in spacecraft_to_target_vectors
+    ]
+    assert expected == [True, False, False, True, False]
+    assert [sensor.target_is_accessible(body_to_frame_rotation, target_vector) for target_vector in spacecraft_to_target_vectors] == expected
+    assert sensor.targets_accessible_batch(body_to_frame_rotation, spacecraft_to_target_vectors).tolist() == expected
+
+def test_sensor_access_batch_applies_exclusion_zones():
+    sensor = BasicSensor("sensor", np.array([1.0, 0.0, 0.0]), 30.0, 30.0, 1000.0, 10.0)
+    body_to_frame_rotation = np.eye(3)
+    spacecraft_to_target_vectors = np.array([[500.0, 10.0, 0.0], [0.0, 500.0, 0.0]])
+    spacecraft_to_earth_vector = np.array([0.0, 0.0, -7000.0])
+
+    assert sensor.sensor_access_batch(body_to_frame_rotation, spacecraft_to_target_vectors, np.array([0.0, 1.5e8, 0.0]), spacecraft_to_earth_vector).tolist() == [True, False]
+    assert sensor.sensor_access_batch(body_to_frame_rotation, spacecraft_to_target_vectors, np.array([1.5e8, 1.0e7, 0.0]), spacecraft_to_earth_vector).tolist() == [False, False]
+
+def test_per_call_rotation_keeps_set_frame():
+    sensor = BasicSensor("sensor", np.array([1.0, 0.0, 0.0]), 30.0, 30.0, 1000.0, 10.0)
+    sensor.set_frame(np.eye(3))
+    spacecraft_to_target_vector = np.array([500.0, 10.0, 0.0])
+    assert sensor.target_is_accessible(None, spacecraft_to_target_vector)
+
+    # Pointing the boresight along y for one call must not move the frame given to set_frame
+    body_to_frame_rotation = R.from_euler("z", 90, degrees=True)
+    for _ in range(2):
+        assert not sensor.target_is_accessible(body_to_frame_rotation, spacecraft_to_target_vector)
+        assert sensor.target_is_accessible(body_to_frame_rotation, np.array([-10.0, 500.0, 0.0]))
+        assert sensor.target_is_accessible(None, spacecraft_to_target_vector)
+    assert not sensor.target_is_accessible(body_to_frame_rotation.as_matrix(), spacecraft_to_target_vector)
+    assert sensor.target_is_accessible(None, spacecraft_to_target_vector)
+
+def test_setters_update_cached_cosines_and_frame():
+    sensor = BasicSensor("sensor", np.array([1.0, 0.0, 0.0]), 30.0, 30.0, 1000.0, 10.0)
+    sensor.set_frame(np.eye(3))
+    spacecraft_to_target_vector = np.array([500.0, 130.0, 0.0])
+    assert not sensor.target_is_accessible(None, spacecraft_to_target_vector)
+
+    sensor.field_of_view_half_angle_deg = 20.0
+    assert sensor.target_is_accessible(None, spacecraft_to_target_vector)
+    sensor.effective_range_km = 100.0
+    assert not sensor.target_is_accessible(None, spacecraft_to_target_vector)
+
+    sensor.effective_range_km = 1000.0
+    sensor.boresight_unit_vector = np.array([0.0, 1.0, 0.0])
+    assert not sensor.target_is_accessible(None, spacecraft_to_target_vector)
+    assert sensor.target_is_accessible(None, np.array([-130.0, 500.0, 0.0]))
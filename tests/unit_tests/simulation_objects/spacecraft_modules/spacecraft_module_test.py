@@ -2,4 +2,16 @@
 
 # Third party imports
 
-# Local imports
\ No newline at end of file
+# Local imports
+from pystrodynamics.simulation_objects.spacecraft_modules.spacecraft_module import SpacecraftModule
+
+def test_power_state_transitions():
+    spacecraft_module = SpacecraftModule("module")
+    assert spacecraft_module.power_state == "OFF"
+
+    spacecraft_module.turn_on()
+    assert spacecraft_module.power_state == "ON"
+    spacecraft_module.set_idle()
+    assert spacecraft_module.power_state == "IDLE"
+    spacecraft_module.turn_off()
+    assert spacecraft_module.power_state == "OFF"
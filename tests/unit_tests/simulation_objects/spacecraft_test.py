@@ -1,5 +1,139 @@
 # Standard library imports
+from datetime import datetime
 
 # Third party imports
+import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation as R
 
-# Local imports
\ No newline at end of file
+# Local imports
+from pystrodynamics.simulation_objects.spacecraft import Spacecraft
+from pystrodynamics.simulation_objects.spacecraft_modules.basic_sensor import BasicSensor
+
+ISS_TLE_LINE1 = "1 25544U 98067A   23339.50000000  .00016717  00000-0  10270-3 0  9005"
+ISS_TLE_LINE2 = "2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391563537"
+
+BODY_TO_GCRS_ROTATION = R.from_euler("xyz", [10.0, 20.0, 30.0], degrees=True)
+BODY_TO_TEME_ROTATION = R.from_euler("zyx", [-40.0, 15.0, 5.0], degrees=True)
+
+def make_spacecraft() -> Spacecraft:
+    spacecraft = Spacecraft("ISS", datetime(2023, 12, 5, 15), ISS_TLE_LINE1, ISS_TLE_LINE2)
+    spacecraft.set_body_to_gcrs_rotation(BODY_TO_GCRS_ROTATION)
+    return spacecraft
+
+def add_sensors_around(spacecraft: Spacecraft, vector_body: np.ndarray) -> None:
+    """Adds sensors pointing toward, away from and 45 degrees off a body frame vector, with 30 and 60 degree exclusion angles."""
+    toward = vector_body / np.linalg.norm(vector_body)
+    normal = np.cross(toward, [0.0, 0.0, 1.0])
+    normal /= np.linalg.norm(normal)
+    off_45_deg = (toward + normal) / np.sqrt(2.0)
+    for name, boresight, exclusion_angle_deg in [
+        ("toward", toward, 30.0),
+        ("away", -toward, 30.0),
+        ("off_45_deg_narrow", off_45_deg, 30.0),
+        ("off_45_deg_wide", off_45_deg, 60.0),
+        ("toward_not_unit", 3.0 * toward, 30.0),
+    ]:
+        spacecraft.add_sensor(BasicSensor(name, boresight, exclusion_angle_deg, exclusion_angle_deg, 1000.0, 10.0))
+
+@pytest.mark.parametrize("reference_frame", ["GCRS", "TEME", "LVLH"])
+def test_earth_exclusion_zones_match_basic_sensor(reference_frame):
+    spacecraft = make_spacecraft()
+    body_to_frame_matrix = {
+        "GCRS": spacecraft.get_body_to_gcrs_matrix(),
+        "TEME": BODY_TO_TEME_ROTATION.as_matrix(),
+        "LVLH": spacecraft.get_body_to_lvlh_matrix(),
+    }[reference_frame]
+    spacecraft_earth_vector = getattr(spacecraft, f"spacecraft_earth_vector_{reference_frame.lower()}")
+    add_sensors_around(spacecraft, body_to_frame_matrix.T @ spacecraft_earth_vector)
+
+    expected = [sensor.name for sensor in spacecraft.sensors if sensor.earth_exclusion_zone_violated(body_to_frame_matrix, spacecraft_earth_vector)]
+    assert expected == ["toward", "off_45_deg_wide", "toward_not_unit"]
+    assert spacecraft.check_sensor_earth_exclusion_zones(reference_frame, BODY_TO_TEME_ROTATION) == expected
+    assert spacecraft.check_sensor_earth_exclusion_zones(reference_frame, BODY_TO_TEME_ROTATION.as_matrix()) == expected
+
+def test_sun_and_earth_exclusion_zones_match_single_checks():
+    spacecraft = make_spacecraft()
+    add_sensors_around(spacecraft, spacecraft.get_body_to_gcrs_matrix().T @ spacecraft.spacecraft_sun_vector_gcrs)
+
+    for reference_frame in ["GCRS", "TEME", "LVLH"]:
+        assert spacecraft.check_sensor_sun_and_earth_exclusion_zones(reference_frame, BODY_TO_TEME_ROTATION) == (
+            spacecraft.check_sensor_sun_exclusion_zones(reference_frame, BODY_TO_TEME_ROTATION),
+            spacecraft.check_sensor_earth_exclusion_zones(reference_frame, BODY_TO_TEME_ROTATION),
+        )
+    assert spacecraft.check_sensor_sun_exclusion_zones("GCRS") == ["toward", "off_45_deg_wide", "toward_not_unit"]
+
+@pytest.mark.parametrize("reference_frame", ["GCRS", "TEME", "LVLH"])
+def test_exclusion_zones_without_sensors(reference_frame):
+    # No attitude either: nothing needs resolving when there are no sensors to check
+    spacecraft = Spacecraft("ISS", datetime(2023, 12, 5, 15), ISS_TLE_LINE1, ISS_TLE_LINE2)
+
+    assert spacecraft.check_sensor_sun_exclusion_zones(reference_frame) == []
+    assert spacecraft.check_sensor_earth_exclusion_zones(reference_frame) == []
+    assert spacecraft.check_sensor_sun_and_earth_exclusion_zones(reference_frame) == ([], [])
+
+def test_sensor_arrays_follow_sensor_changes():
+    spacecraft = make_spacecraft()
+    body_to_gcrs_matrix = spacecraft.get_body_to_gcrs_matrix()
+    earth_vector_body = body_to_gcrs_matrix.T @ spacecraft.spacecraft_earth_vector_gcrs
+    sensor = BasicSensor("sensor", -earth_vector_body / np.linalg.norm(earth_vector_body), 30.0, 30.0, 1000.0, 10.0)
+    spacecraft.add_sensor(sensor)
+    assert spacecraft.check_sensor_earth_exclusion_zones("GCRS") == []
+
+    # Boresights can only be changed by assigning a new vector, which marks the sensor arrays stale
+    with pytest.raises(ValueError):
+        sensor.boresight_unit_vector[:] = -sensor.boresight_unit_vector
+    sensor.boresight_unit_vector = -sensor.boresight_unit_vector
+    assert spacecraft.check_sensor_earth_exclusion_zones("GCRS") == ["sensor"]
+
+    spacecraft.sensors.append(BasicSensor("appended", sensor.boresight_unit_vector.copy(), 30.0, 30.0, 1000.0, 10.0))
+    assert spacecraft.check_sensor_earth_exclusion_zones("GCRS") == ["sensor", "appended"]
+
+    # 45 degrees off the Earth, so only the exclusion angle decides
+    normal = np.cross(sensor.boresight_unit_vector, [0.0, 0.0, 1.0])
+    sensor.boresight_unit_vector = (sensor.boresight_unit_vector + normal / np.linalg.norm(normal)) / np.sqrt(2.0)
+    assert spacecraft.check_sensor_earth_exclusion_zones("GCRS") == ["appended"]
+    sensor.earth_exclusion_angle_deg = 60.0
+    sensor.name = "renamed"
+    assert spacecraft.check_sensor_earth_exclusion_zones("GCRS") == ["renamed", "appended"]
+
+def test_body_to_gcrs_attitude_stored_as_matrix():
+    spacecraft = Spacecraft("ISS", datetime(2023, 12, 5, 15), ISS_TLE_LINE1, ISS_TLE_LINE2)
+    assert spacecraft.body_to_gcrs_rotation is None
+    with pytest.raises(AttributeError):
+        spacecraft.get_body_to_gcrs_matrix()
+
+    spacecraft.set_body_to_gcrs_rotation(BODY_TO_GCRS_ROTATION)
+    body_to_gcrs_matrix = spacecraft.get_body_to_gcrs_matrix()
+    assert body_to_gcrs_matrix.dtype == np.float64
+    assert body_to_gcrs_matrix.flags.c_contiguous
+    assert np.allclose(body_to_gcrs_matrix, BODY_TO_GCRS_ROTATION.as_matrix())
+    assert np.allclose(spacecraft.get_body_to_gcrs_rotation().as_quat(), BODY_TO_GCRS_ROTATION.as_quat())
+
+    assert spacecraft.body_to_gcrs_rotation is not None
+    assert np.allclose(spacecraft.body_to_gcrs_rotation.as_quat(), BODY_TO_GCRS_ROTATION.as_quat())
+
+    # The caller's matrix is copied, so changing it later leaves the attitude and its cached LVLH matrix alone
+    body_to_teme_matrix = BODY_TO_TEME_ROTATION.as_matrix()
+    spacecraft.set_body_to_gcrs_rotation(body_to_teme_matrix)
+    body_to_lvlh_matrix = spacecraft.get_body_to_lvlh_matrix().copy()
+    body_to_teme_matrix[:] = np.eye(3)
+    assert np.allclose(spacecraft.get_body_to_gcrs_matrix(), BODY_TO_TEME_ROTATION.as_matrix())
+    assert np.allclose(spacecraft.get_body_to_lvlh_matrix(), body_to_lvlh_matrix)
+    assert not spacecraft.get_body_to_gcrs_matrix().flags.writeable
+    with pytest.raises(ValueError):
+        spacecraft.set_body_to_gcrs_rotation(np.eye(4))
+
+def test_body_to_lvlh_matrix_cached_until_state_or_attitude_changes():
+    spacecraft = make_spacecraft()
+
+    body_to_lvlh_matrix = spacecraft.get_body_to_lvlh_matrix()
+    assert np.allclose(body_to_lvlh_matrix, spacecraft.gcrs_to_lvlh_matrix @ spacecraft.get_body_to_gcrs_matrix())
+    assert spacecraft.get_body_to_lvlh_matrix() is body_to_lvlh_matrix
+
+    spacecraft.update_state(datetime(2023, 12, 5, 15, 30))
+    assert spacecraft.get_body_to_lvlh_matrix() is not body_to_lvlh_matrix
+    assert np.allclose(spacecraft.get_body_to_lvlh_matrix(), spacecraft.gcrs_to_lvlh_matrix @ spacecraft.get_body_to_gcrs_matrix())
+
+    spacecraft.set_body_to_gcrs_rotation(BODY_TO_TEME_ROTATION)
+    assert np.allclose(spacecraft.get_body_to_lvlh_matrix(), spacecraft.gcrs_to_lvlh_matrix @ BODY_TO_TEME_ROTATION.as_matrix())
@@ -1,5 +1,37 @@
 # Standard library imports
+from datetime import datetime, timedelta
 
 # Third party imports
+import numpy as np
+import pytest
 
-# Local imports
\ No newline at end of file
+# Local imports
+from pystrodynamics.simulation_objects.the_sun import TheSun
+from pystrodynamics.utils.sun import SunVectorInterpolator
+
+@pytest.mark.parametrize("reference_frame", ["GCRS", "TEME"])
+def test_attached_interpolator_serves_its_frame(reference_frame):
+    start_epoch = datetime(2015, 3, 2, 1, 0, 0)
+    interpolator = SunVectorInterpolator(start_epoch, start_epoch + timedelta(hours=2), reference_frame=reference_frame)
+    sun = TheSun("Sun", start_epoch + timedelta(minutes=17, seconds=3))
+    sun.attach_interpolator(interpolator)
+
+    # Off grid, so only the spline gives exactly this vector
+    for epoch in [start_epoch + timedelta(minutes=17, seconds=3), start_epoch + timedelta(hours=1, minutes=4, seconds=41)]:
+        sun.update_state(epoch)
+        earth_sun_vector = getattr(sun, f"earth_sun_vector_{reference_frame.lower()}")
+        assert np.array_equal(earth_sun_vector, interpolator.earth_sun_vector(epoch))
+        # Read-only like the memoized ephemeris lookups, whichever source serves the frame
+        assert not earth_sun_vector.flags.writeable
+
+def test_interpolator_replaces_vector_already_looked_up():
+    start_epoch = datetime(2015, 3, 2, 1, 0, 0)
+    epoch = start_epoch + timedelta(minutes=17, seconds=3)
+    sun = TheSun("Sun", epoch)
+    looked_up = sun.earth_sun_vector_gcrs
+    assert not looked_up.flags.writeable
+
+    interpolator = SunVectorInterpolator(start_epoch, start_epoch + timedelta(hours=1))
+    sun.attach_interpolator(interpolator)
+    assert np.array_equal(sun.earth_sun_vector_gcrs, interpolator.earth_sun_vector(epoch))
+    assert not np.array_equal(sun.earth_sun_vector_gcrs, looked_up)
@@ -1,18 +1,43 @@
 # Standard library imports
 
 # Third party imports
+import numpy as np
 
 # Local imports
-from pystrodynamics.utils.eclipse import check_object_shadows, is_in_eclipse
+from pystrodynamics.utils.eclipse import check_object_shadows, check_object_shadows_batch, is_in_eclipse, is_in_eclipse_batch, is_in_penumbra_only
+
+EARTH_SUN_VECTOR = np.array([1.496e8, 0.0, 0.0])
 
 def test_check_object_shadows_with_validation_data():
-    pass
+    # Directly behind the Earth: umbra (and so penumbra)
+    assert check_object_shadows(np.array([-7000.0, 0.0, 0.0]), EARTH_SUN_VECTOR) == (True, True)
+    # Sunlit side
+    assert check_object_shadows(np.array([7000.0, 0.0, 0.0]), EARTH_SUN_VECTOR) == (False, False)
+    # Just outside the umbra cone, but inside the penumbra cone
+    assert check_object_shadows(np.array([-7000.0, 6390.0, 0.0]), EARTH_SUN_VECTOR) == (False, True)
+    # Beside the Earth, clear of both cones
+    assert check_object_shadows(np.array([-7000.0, 6500.0, 0.0]), EARTH_SUN_VECTOR) == (False, False)
 
 def test_check_object_shadows_bad_vectors():
     pass
 
 def test_is_in_eclipse_with_validation_data():
-    pass
+    assert is_in_eclipse(np.array([-7000.0, 0.0, 0.0]), EARTH_SUN_VECTOR)
+    assert is_in_eclipse(np.array([-7000.0, 6390.0, 0.0]), EARTH_SUN_VECTOR)
+    assert not is_in_eclipse(np.array([7000.0, 0.0, 0.0]), EARTH_SUN_VECTOR)
+
+    assert is_in_penumbra_only(np.array([-7000.0, 6390.0, 0.0]), EARTH_SUN_VECTOR)
+    assert not is_in_penumbra_only(np.array([-7000.0, 0.0, 0.0]), EARTH_SUN_VECTOR)
+    assert not is_in_penumbra_only(np.array([-7000.0, 6500.0, 0.0]), EARTH_SUN_VECTOR)
+
+def test_batch_shadow_checks_match_scalar_checks():
+    earth_object_position_vectors = np.array([[-7000.0, 0.0, 0.0], [7000.0, 0.0, 0.0], [-7000.0, 6390.0, 0.0], [-7000.0, 6500.0, 0.0]])
+    expected = np.array([check_object_shadows(position_vector, EARTH_SUN_VECTOR) for position_vector in earth_object_position_vectors])
+
+    in_umbra, in_penumbra = check_object_shadows_batch(earth_object_position_vectors, np.tile(EARTH_SUN_VECTOR, (4, 1)))
+    assert np.array_equal(in_umbra, expected[:, 0])
+    assert np.array_equal(in_penumbra, expected[:, 1])
+    assert np.array_equal(is_in_eclipse_batch(earth_object_position_vectors, EARTH_SUN_VECTOR), [True, False, True, False])
 
 def test_is_in_eclipse_bad_vectors():
     pass
@@ -1,27 +1,46 @@
 # Standard library imports
 
 # Third party imports
+import numpy as np
+import pytest
 
 # Local imports
-from pystrodynamics.utils.math import unit_vector, norm, angle_between_vectors
+from pystrodynamics.utils.math import unit_vector, norm, angle_between_vectors, angle_between_vectors_batch
 
 def test_unit_vector_with_validation_data():
-    pass
+    assert np.allclose(unit_vector(np.array([3.0, 0.0, 4.0])), [0.6, 0.0, 0.8])
+    assert unit_vector(np.array([3.0, 0.0, 4.0], dtype=np.float32)).dtype == np.float32
 
 def test_unit_vector_bad_vector():
     pass
 
 def test_norm_with_validation_data():
-    pass
+    assert norm(np.array([2.0, -3.0, 6.0])) == 7.0
+    assert np.allclose(norm(np.array([[2.0, 3.0], [-3.0, 4.0], [6.0, 0.0]])), [7.0, 5.0])
 
 def test_norm_with_bad_vector():
     pass
 
 def test_angle_between_vectors_with_validation_data():
-    pass
+    assert np.isclose(angle_between_vectors(np.array([1.0, 0.0, 0.0]), np.array([0.0, 2.0, 0.0]), "degrees"), 90.0)
+    assert np.isclose(angle_between_vectors(np.array([1.0, 1.0, 0.0]), np.array([3.0, 0.0, 0.0])), np.pi / 4)
+    assert angle_between_vectors(np.array([1.0, 2.0, 3.0]), np.array([2.0, 4.0, 6.0])) == 0.0
+
+    a = np.array([[1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 0.0, 5.0]])
+    b = np.array([[0.0, 2.0, 0.0], [3.0, 0.0, 0.0], [0.0, 0.0, -1.0]])
+    expected = [angle_between_vectors(a_row, b_row, "degrees") for a_row, b_row in zip(a, b)]
+    assert np.allclose(angle_between_vectors_batch(a, b, "degrees"), expected)
+    assert np.allclose(angle_between_vectors(a.T, b.T, "degrees"), expected)
 
 def test_angle_between_vectors_bad_vectors():
     pass
 
 def test_angle_between_vectors_bad_units():
-    pass
+    a = np.array([1.0, 0.0, 0.0])
+    b = np.array([0.0, 2.0, 0.0])
+    with pytest.raises(ValueError):
+        angle_between_vectors(a, b, "gradians")
+    with pytest.raises(ValueError):
+        angle_between_vectors(np.column_stack((a, b)), np.column_stack((b, a)), "gradians")
+    with pytest.raises(ValueError):
+        angle_between_vectors_batch(np.vstack((a, b)), np.vstack((b, a)), "gradians")
@@ -1,12 +1,51 @@
 # Standard library imports
+from datetime import datetime, timedelta
 
 # Third party imports
+import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation as R
+from sgp4.api import jday
 
 # Local imports
-from pystrodynamics.utils.propagation import tle_and_epoch_to_state_vectors, state_vectors_to_coe
+from pystrodynamics.utils.propagation import TemeToGcrsRotationGrid, datetimes_to_jd_fr, parse_tle, tle_and_epoch_to_state_vectors, tle_to_state_vectors_batch, state_vectors_to_coe, teme_to_gcrs_rotation_matrix
+
+ISS_TLE_LINE1 = "1 25544U 98067A   23339.50000000  .00016717  00000-0  10270-3 0  9005"
+ISS_TLE_LINE2 = "2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391563537"
+
+@pytest.mark.parametrize(
+    "epoch",
+    [
+        datetime(2023, 12, 5, 0, 0, 0),
+        datetime(2023, 12, 5, 15, 0, 0, 500000),
+        datetime(2023, 12, 5, 23, 59, 59, 999999),
+        datetime(2024, 2, 29, 12, 34, 56, 123456),
+        datetime(2000, 1, 1, 12, 0, 0),
+    ],
+)
+def test_datetimes_to_jd_fr_matches_jday(epoch):
+    jd, fr = datetimes_to_jd_fr([epoch, epoch + timedelta(days=1)])
+    for index, day in enumerate((epoch, epoch + timedelta(days=1))):
+        expected_jd, expected_fr = jday(day.year, day.month, day.day, day.hour, day.minute, day.second + day.microsecond / 1000000)
+        assert jd[index] == expected_jd
+        assert fr[index] == pytest.approx(expected_fr, rel=0, abs=1e-15)
 
 def test_tle_and_epoch_to_state_vectors_with_validation_data():
-    pass
+    epoch = datetime(2023, 12, 5, 15, 0, 0, 500000)
+
+    # TEME from sgp4 directly, GCRS from skyfield's EarthSatellite
+    position_vector_teme, velocity_vector_teme = tle_and_epoch_to_state_vectors(ISS_TLE_LINE1, ISS_TLE_LINE2, epoch, "TEME")
+    assert np.allclose(position_vector_teme, [3509.88059469, -2334.87838951, 5234.39180459])
+    assert np.allclose(velocity_vector_teme, [3.50979319, 6.82375019, 0.68383668])
+
+    position_vector_gcrs, velocity_vector_gcrs = tle_and_epoch_to_state_vectors(ISS_TLE_LINE1, ISS_TLE_LINE2, epoch, "GCRS")
+    assert np.allclose(position_vector_gcrs, [3509.42550836, -2353.45294004, 5226.37238503])
+    assert np.allclose(velocity_vector_gcrs, [3.54782534, 6.80489513, 0.67541474])
+
+def test_parse_tle_is_cached_per_tle():
+    satellite = parse_tle(ISS_TLE_LINE1, ISS_TLE_LINE2)
+    assert satellite is parse_tle(ISS_TLE_LINE1, ISS_TLE_LINE2)
+    assert satellite.satnum == 25544
 
 def test_tle_and_epoch_to_state_vectors_bad_tle():
     pass
@@ -14,8 +53,44 @@ def test_tle_and_epoch_to_state_vectors_bad_tle():
 def test_tle_and_epoch_to_state_vectors_bad_epoch():
     pass
 
+def test_tle_to_state_vectors_batch_matches_single_epoch():
+    epochs = [datetime(2023, 12, 5, 15) + timedelta(minutes=minute) for minute in range(0, 120, 17)]
+
+    for reference_frame in ("TEME", "GCRS"):
+        position_vectors, velocity_vectors = tle_to_state_vectors_batch(ISS_TLE_LINE1, ISS_TLE_LINE2, epochs, reference_frame)
+        assert position_vectors.shape == (len(epochs), 3)
+        for epoch, position_vector, velocity_vector in zip(epochs, position_vectors, velocity_vectors):
+            expected_position_vector, expected_velocity_vector = tle_and_epoch_to_state_vectors(ISS_TLE_LINE1, ISS_TLE_LINE2, epoch, reference_frame)
+            assert np.allclose(position_vector, expected_position_vector, rtol=0, atol=1e-6)
+            assert np.allclose(velocity_vector, expected_velocity_vector, rtol=0, atol=1e-9)
+
 def test_state_vectors_to_coe_with_validation_data():
     pass
 
 def test_state_vectors_to_coe_bad_vectors():
     pass
+
+def test_teme_to_gcrs_rotation_grid_matches_exact_rotation():
+    start_epoch = datetime(2023, 12, 5, 15)
+    rotation_grid = TemeToGcrsRotationGrid(start_epoch, start_epoch + timedelta(hours=2))
+
+    for seconds in (0, 95, 1800, 4321, 7200):
+        epoch = start_epoch + timedelta(seconds=seconds)
+        interpolated = rotation_grid.rotation_matrix(epoch)
+        assert np.allclose(interpolated @ interpolated.T, np.eye(3))
+        assert np.allclose(interpolated, teme_to_gcrs_rotation_matrix(epoch), rtol=0, atol=1e-12)
+
+    with pytest.raises(ValueError):
+        rotation_grid.rotation_matrix(start_epoch - timedelta(seconds=1))
+
+def test_teme_to_gcrs_rotation_grid_error_within_documented_bound():
+    start_epoch = datetime(2023, 12, 5, 15)
+    rotation_grid = TemeToGcrsRotationGrid(start_epoch, start_epoch + timedelta(days=1))
+
+    # Below 1 microarcsecond at the default spacing, checked off grid across a whole day
+    worst_error_rad = 0.0
+    for seconds in range(0, 86400, 97):
+        epoch = start_epoch + timedelta(seconds=seconds)
+        error = R.from_matrix(rotation_grid.rotation_matrix(epoch) @ teme_to_gcrs_rotation_matrix(epoch).T)
+        worst_error_rad = max(worst_error_rad, error.magnitude())
+    assert np.degrees(worst_error_rad) * 3600e6 < 1.0
@@ -5,10 +5,19 @@ import numpy as np
 import pytest
 
 # Local imports
-from pystrodynamics.utils.rotations import gcrs_to_lvlh_rotation
+from pystrodynamics.utils.rotations import gcrs_to_lvlh_matrix, gcrs_to_lvlh_rotation
 
 def test_gcrs_to_lvlh_rotation_with_validation_data():
-    pass
+    position_vector_gcrs = np.array([7000.0, 0.0, 0.0])
+    velocity_vector_gcrs = np.array([0.0, 7.5, 0.0])
+
+    # z points towards Earth, y opposite the orbit normal, x along the velocity
+    expected_matrix = np.array([[0.0, 1.0, 0.0], [0.0, 0.0, -1.0], [-1.0, 0.0, 0.0]])
+    assert np.allclose(gcrs_to_lvlh_matrix(position_vector_gcrs, velocity_vector_gcrs), expected_matrix)
+
+    rotation = gcrs_to_lvlh_rotation(position_vector_gcrs, velocity_vector_gcrs)
+    assert np.allclose(rotation.apply(-position_vector_gcrs), [0.0, 0.0, 7000.0])
+    assert np.allclose(rotation.apply(velocity_vector_gcrs), [7.5, 0.0, 0.0])
 
 def test_gcrs_to_lvlh_rotation_bad_vectors():
     # Bad position vector size
@@ -6,105 +6,217 @@ and provide test cases with expected results.
 """
 
 # Standard library imports
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 
 # Third party imports
 import numpy as np
 import pandas as pd
 import pytest
+from skyfield.sgp4lib import TEME
 
 # Local application imports
 # from custom_logger import setup_logging
-from pystrodynamics.utils.sun import get_earth_sun_vector_gcrs_at_epoch, get_earth_sun_vector_teme_at_epoch
-from pystrodynamics.utils.math import angle_between_vectors
-
-@pytest.fixture
+from pystrodynamics.utils.sun import (
+    SunVectorInterpolator,
+    get_cached_earth_sun_vector_gcrs_at_epoch,
+    get_cached_earth_sun_vector_teme_at_epoch,
+    get_earth_sun_vector_gcrs_at_epoch,
+    get_earth_sun_vector_teme_at_epoch,
+    get_earth_sun_vectors_gcrs_at_epochs,
+    get_earth_sun_vectors_teme_at_epochs,
+    get_times_at_epochs,
+)
+from pystrodynamics.utils.math import angle_between_vectors_batch
+
+# Resolved from this file so the tests run from any working directory
+_TEST_DATA_PATH = Path(__file__).resolve().parents[2] / "data" / "earth_sun_vector_test_data.csv"
+
+# Number of contiguous epoch blocks each frame test is split into, so failures are reported
+# per block and the blocks can run on separate workers (e.g. with pytest-xdist)
+_NUMBER_OF_EPOCH_BLOCKS = 8
+
+# Every how many epochs the scalar TEME lookup, which has no batched rotation, is checked
+_SCALAR_TEME_STRIDE = 12
+
+
+def _epoch_block(number_of_epochs, block):
+    """Returns the slice of the test epochs covered by one parametrized block."""
+    return slice(block * number_of_epochs // _NUMBER_OF_EPOCH_BLOCKS, (block + 1) * number_of_epochs // _NUMBER_OF_EPOCH_BLOCKS)
+
+
+# Validation columns read from the CSV, MJ2000 then TEME
+_TRUTH_COLUMNS = [
+    "Sun_Earth_MJ2000_X_km",  # MJ2000 is supposedly accurate to GCRS within milliarcseconds
+    "Sun_Earth_MJ2000_Y_km",
+    "Sun_Earth_MJ2000_Z_km",
+    "Sun_Earth_TEME_X_km",
+    "Sun_Earth_TEME_Y_km",
+    "Sun_Earth_TEME_Z_km",
+]
+
+
+@pytest.fixture(scope="session")
 def test_data():
-    """Fixture to load test data from a CSV file."""
-    yield pd.read_csv("tests/data/earth_sun_vector_test_data.csv")
-
+    """Fixture to load test data from a CSV file once per session.
 
-def test_get_earth_sun_vector_gcrs_at_epoch_with_freeflyer_data(test_data):
+    Returns:
+        dict: epochs as datetimes, their skyfield times per block, and (N, 3) Earth-Sun truth vectors
+        in MJ2000 and TEME.
+    """
+    if not _TEST_DATA_PATH.exists():
+        pytest.skip(f"validation CSV missing: {_TEST_DATA_PATH}")
+    df = pd.read_csv(
+        _TEST_DATA_PATH,
+        usecols=["Epoch_ISO8601_UTC", *_TRUTH_COLUMNS],
+        dtype={"Epoch_ISO8601_UTC": "string", **{column: "float64" for column in _TRUTH_COLUMNS}},
+    )
+    # parse the whole epoch column in one vectorized call; datetime only keeps microseconds
+    epochs = pd.to_datetime(
+        df["Epoch_ISO8601_UTC"].str[:26].to_numpy(), format="%Y-%m-%dT%H:%M:%S.%f", cache=True
+    ).to_pydatetime()
+    # validation data has Sun-Earth, we want Earth-Sun; negate both frames in one buffer
+    truth = -df[_TRUTH_COLUMNS].to_numpy(dtype=np.float64)
+    # one set of skyfield times per block, shared by the GCRS and TEME tests
+    times = [get_times_at_epochs(epochs[_epoch_block(len(epochs), block)]) for block in range(_NUMBER_OF_EPOCH_BLOCKS)]
+    # computed GCRS vectors per block, filled on first use and shared by the GCRS and TEME tests
+    gcrs = [None] * _NUMBER_OF_EPOCH_BLOCKS
+    return {"epochs": epochs, "times": times, "gcrs": gcrs, "mj2000": truth[:, :3], "teme": truth[:, 3:]}
+
+
+def _computed_gcrs_vectors(test_data, block):
+    """Returns the computed (N, 3) GCRS Earth-Sun vectors of a block, looking them up once per session."""
+    if test_data["gcrs"][block] is None:
+        test_data["gcrs"][block] = get_earth_sun_vectors_gcrs_at_epochs(test_data["times"][block])
+    return test_data["gcrs"][block]
+
+
+def _assert_angles_within_tolerance(test_position_vectors, expected_position_vectors, epochs):
+    """Asserts that (N, 3) computed vectors are within milliarcseconds of the expected ones, naming failing epochs."""
+    angles_between = angle_between_vectors_batch(test_position_vectors, expected_position_vectors, "degrees")
+
+    # logger.info(f"Test Cases: {len(angles_between)}\tMax Angle Diff (degs): {np.max(angles_between)}\tMax Angle Diff (arcsec): {np.max(angles_between) * 3600}")
+
+    # accurate to within milliarcseconds
+    exceeded = np.abs(angles_between) >= 0.00001
+    assert not exceeded.any(), (
+        f"{np.count_nonzero(exceeded)} epochs exceeded tolerance (worst {np.max(np.abs(angles_between))} degs): "
+        f"{[str(epoch) for epoch in epochs[exceeded]]}"
+    )
+
+
+@pytest.mark.parametrize("block", range(_NUMBER_OF_EPOCH_BLOCKS))
+def test_get_earth_sun_vector_gcrs_at_epoch_with_freeflyer_data(test_data, block):
     """Test function for get_earth_sun_vector_gcrs_at_epoch with freeflyer data.
 
     Args:
-        test_data (pd.DataFrame): Test data containing epochs and expected results.
+        test_data (dict): Test data containing epochs and expected results.
+        block (int): Index of the block of epochs to validate.
 
-    This test function iterates through the provided test data and validates the accuracy
-    of the calculated Earth-Sun vector in the GCRS frame at the given epochs.
+    This test function computes the Earth-Sun vectors in the GCRS frame for one block of the provided
+    epochs in one batched call and validates their angles from the test data in one batched call.
     """
 
     # logging
     # logger = setup_logging(f"get_earth_sun_vector_gcrs_at_epoch_{datetime.now()}")
 
-    test_count = 0
+    block_epochs = _epoch_block(len(test_data["epochs"]), block)
+
+    # get actual sun vectors for every epoch in the block in one call
+    test_position_vectors = _computed_gcrs_vectors(test_data, block)
 
     # Validate the results
-    for _, row in test_data.iterrows():
-        test_count += 1
-        
-        # extract arg for function
-        epoch = datetime.fromisoformat(row["Epoch_ISO8601_UTC"][:26])
+    _assert_angles_within_tolerance(test_position_vectors, test_data["mj2000"][block_epochs], test_data["epochs"][block_epochs])
 
-        # get actual sun vector
-        test_position_vector = get_earth_sun_vector_gcrs_at_epoch(epoch)
 
-        # get desired sun vector
-        true_position_vector = np.array(
-            [
-                row["Sun_Earth_MJ2000_X_km"],  # MJ2000 is supposedly accurate to GCRS within milliarcseconds
-                row["Sun_Earth_MJ2000_Y_km"],
-                row["Sun_Earth_MJ2000_Z_km"],
-            ]
-        )
-        true_position_vector = -true_position_vector  # validation data has Sun-Earth, we want Earth-Sun
+@pytest.mark.parametrize("block", range(_NUMBER_OF_EPOCH_BLOCKS))
+def test_get_earth_sun_vector_teme_at_epoch_with_freeflyer_data(test_data, block):
+    """Test function for get_earth_sun_vector_teme_at_epoch with freeflyer data.
 
-        angle_between = angle_between_vectors(test_position_vector, true_position_vector, "degrees")
+    Args:
+        test_data (dict): Test data containing epochs and expected results.
+        block (int): Index of the block of epochs to validate.
 
-        # logger.info(f"Test Case: {test_count}\tCalculated Vector: {test_position_vector}\tTrue Vector: {true_position_vector}\tAngle Diff (degs): {angle_between}\tAngle Diff (arcsec): {angle_between * 3600}")
+    This test function validates the angles from the test data of get_earth_sun_vectors_teme_at_epochs
+    over the whole block, of get_earth_sun_vector_teme_at_epoch at every _SCALAR_TEME_STRIDE-th epoch, and
+    of the block's computed GCRS Earth-Sun vectors rotated into the TEME frame in one batched multiply.
+    """
 
-        # accurate to within milliarcseconds
-        assert np.abs(angle_between) < 0.00001
+    # logging
+    # logger = setup_logging(f"get_earth_sun_vector_teme_at_epoch_{datetime.now()}")
 
+    block_epochs = _epoch_block(len(test_data["epochs"]), block)
+    epochs = test_data["epochs"][block_epochs]
+    truth = test_data["teme"][block_epochs]
 
-def test_get_earth_sun_vector_teme_at_epoch_with_freeflyer_data(test_data):
-    """Test function for get_earth_sun_vector_teme_at_epoch with freeflyer data.
+    # the library's batched TEME lookup for every epoch in the block
+    times = test_data["times"][block]
+    _assert_angles_within_tolerance(get_earth_sun_vectors_teme_at_epochs(times), truth, epochs)
+
+    # the library's scalar TEME lookup for a sample of the block, one epoch at a time
+    sampled = slice(None, None, _SCALAR_TEME_STRIDE)
+    scalar_position_vectors = np.array([get_earth_sun_vector_teme_at_epoch(epoch) for epoch in epochs[sampled]])
+    _assert_angles_within_tolerance(scalar_position_vectors, truth[sampled], epochs[sampled])
+
+    # rotate the block's GCRS vectors into TEME with one batched multiply against the (3, 3, N) rotations
+    test_position_vectors = np.einsum("ijn,nj->ni", TEME.rotation_at(times), _computed_gcrs_vectors(test_data, block))
+    _assert_angles_within_tolerance(test_position_vectors, truth, epochs)
+
+
+@pytest.mark.parametrize(
+    "reference_frame, get_earth_sun_vector_at_epoch",
+    [("GCRS", get_earth_sun_vector_gcrs_at_epoch), ("TEME", get_earth_sun_vector_teme_at_epoch)],
+)
+def test_sun_vector_interpolator_matches_ephemeris_between_grid_points(reference_frame, get_earth_sun_vector_at_epoch):
+    """Test function for SunVectorInterpolator against exact lookups at off-grid epochs.
 
     Args:
-        test_data (pd.DataFrame): Test data containing epochs and expected results.
+        reference_frame (str): Frame of the interpolated vectors.
+        get_earth_sun_vector_at_epoch (Callable): Exact lookup in the same frame.
 
-    This test function iterates through the provided test data and validates the accuracy
-    of the calculated Earth-Sun vector in the TEME frame at the given epochs.
+    This test function checks that the spline at the default 10 minute spacing stays within 100 m of
+    the ephemeris at epochs between grid points, including the last partial interval.
     """
+    start_epoch = datetime(2015, 3, 2, 1, 0, 0)
+    interpolator = SunVectorInterpolator(start_epoch, start_epoch + timedelta(hours=6, minutes=3), reference_frame=reference_frame)
 
-    # logging
-    # logger = setup_logging(f"get_earth_sun_vector_teme_at_epoch_{datetime.now()}")
+    for offset in [timedelta(minutes=3, seconds=17), timedelta(hours=2, minutes=45, seconds=0.5), timedelta(hours=6, minutes=1)]:
+        epoch = start_epoch + offset
+        error_km = np.linalg.norm(interpolator.earth_sun_vector(epoch) - get_earth_sun_vector_at_epoch(epoch))
+        assert error_km < 0.1, f"interpolation error {error_km} km at {epoch}"
 
-    test_count = 0
 
-    # Validate the results
-    for _, row in test_data.iterrows():
-        test_count += 1
+def test_sun_vector_interpolator_rejects_epochs_outside_grid():
+    """Test function for SunVectorInterpolator with epochs before and after its grid."""
+    start_epoch = datetime(2015, 3, 2, 1, 0, 0)
+    end_epoch = start_epoch + timedelta(hours=1)
+    interpolator = SunVectorInterpolator(start_epoch, end_epoch)
 
-        # extract arg for function
-        epoch = datetime.fromisoformat(row["Epoch_ISO8601_UTC"][:26])
+    with pytest.raises(ValueError):
+        interpolator.earth_sun_vector(start_epoch - timedelta(seconds=1))
+    with pytest.raises(ValueError):
+        interpolator.earth_sun_vector(end_epoch + timedelta(seconds=1))
 
-        # get actual sun vector
-        test_position_vector = get_earth_sun_vector_teme_at_epoch(epoch)
 
-        # get desired sun vector
-        true_position_vector = np.array(
-            [
-                row["Sun_Earth_TEME_X_km"],
-                row["Sun_Earth_TEME_Y_km"],
-                row["Sun_Earth_TEME_Z_km"],
-            ]
-        )
-        true_position_vector = -true_position_vector  # validation data has Sun-Earth, we want Earth-Sun
+@pytest.mark.parametrize(
+    "get_cached_earth_sun_vector_at_epoch, get_earth_sun_vector_at_epoch",
+    [
+        (get_cached_earth_sun_vector_gcrs_at_epoch, get_earth_sun_vector_gcrs_at_epoch),
+        (get_cached_earth_sun_vector_teme_at_epoch, get_earth_sun_vector_teme_at_epoch),
+    ],
+)
+def test_cached_earth_sun_vector_reads_epochs_as_utc(get_cached_earth_sun_vector_at_epoch, get_earth_sun_vector_at_epoch):
+    """Test function for the memoized getters with aware epochs for one instant in different zones.
 
-        angle_between = angle_between_vectors(test_position_vector, true_position_vector, "degrees")
+    Args:
+        get_cached_earth_sun_vector_at_epoch (Callable): Memoized lookup under test.
+        get_earth_sun_vector_at_epoch (Callable): Lookup in the same frame returning a fresh copy.
 
-        # logger.info(f"Test Case: {test_count}\tCalculated Vector: {test_position_vector}\tTrue Vector: {true_position_vector}\tAngle Diff (degs): {angle_between}\tAngle Diff (arcsec): {angle_between * 3600}")
+    Epochs are read as UTC wall-clock times, so equal instants in different zones must not share a cache entry.
+    """
+    utc_epoch = datetime(2015, 3, 2, 12, 0, 0, tzinfo=timezone.utc)
+    shifted_epoch = utc_epoch.astimezone(timezone(timedelta(hours=2)))
 
-        # accurate to within milliarcseconds
-        assert np.abs(angle_between) < 0.00001
+    assert np.array_equal(get_cached_earth_sun_vector_at_epoch(utc_epoch), get_earth_sun_vector_at_epoch(utc_epoch.replace(tzinfo=None)))
+    assert np.array_equal(get_cached_earth_sun_vector_at_epoch(shifted_epoch), get_earth_sun_vector_at_epoch(datetime(2015, 3, 2, 14, 0, 0)))
+    assert not np.array_equal(get_cached_earth_sun_vector_at_epoch(shifted_epoch), get_cached_earth_sun_vector_at_epoch(utc_epoch))